@@ -0,0 +1,86 @@
+"""
+Módulo: Benchmark de Caché Compartida
+Descripción: Separa lotes en un multiprocessing.Pool con y sin la caché compartida,
+             verifica que el resultado coincide con SeparadorDFA y mide ambos casos
+"""
+
+import argparse
+import collections
+import multiprocessing
+import sys
+import time
+
+from benchmark_motores import generar_palabras_aleatorias
+from cache_compartida import CacheCompartida, inicializar_trabajador, separar_en_trabajador
+from separador_dfa import SeparadorDFA
+
+
+def separar_en_grupo(lotes, procesos, nombre_cache=None):
+    """
+    Separa los lotes en un grupo de procesos.
+    
+    Args:
+        lotes (list): Listas de palabras
+        procesos (int): Procesos del grupo
+        nombre_cache (str): Caché compartida que adjunta cada proceso (None = sin caché)
+        
+    Returns:
+        tuple: (separaciones en orden, segundos)
+    """
+    if nombre_cache is None:
+        grupo = multiprocessing.Pool(procesos)
+    else:
+        grupo = multiprocessing.Pool(procesos, initializer=inicializar_trabajador, initargs=(nombre_cache,))
+    with grupo:
+        inicio = time.perf_counter()
+        resultados = [separacion for lote in grupo.map(separar_en_trabajador, lotes) for separacion in lote]
+        duracion = time.perf_counter() - inicio
+    return resultados, duracion
+
+
+def main():
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de la caché compartida entre procesos")
+    parser.add_argument('--entrada', default='palabras_entrada.txt')
+    parser.add_argument('--repeticiones', type=int, default=200)
+    parser.add_argument('--aleatorias', type=int, default=20000,
+                        help="Palabras aleatorias (poco frecuentes) añadidas al corpus")
+    parser.add_argument('--procesos', type=int, default=2)
+    parser.add_argument('--capacidad', type=int, default=10000,
+                        help="Palabras más frecuentes que se precargan en la caché")
+    parser.add_argument('--lote', type=int, default=2000)
+    args = parser.parse_args()
+    
+    separador = SeparadorDFA()
+    with open(args.entrada, 'r', encoding='utf-8') as f:
+        palabras = [linea.strip() for linea in f if linea.strip()]
+    corpus = palabras * args.repeticiones + generar_palabras_aleatorias(args.aleatorias)
+    lotes = [corpus[i:i + args.lote] for i in range(0, len(corpus), args.lote)]
+    esperado = [separador.separar_silabas(palabra)[0] for palabra in corpus]
+    
+    with CacheCompartida.crear(args.capacidad) as cache:
+        conteo = collections.Counter(separador.normalizar(palabra) for palabra in corpus)
+        precargadas = cache.precargar(conteo.most_common(args.capacidad), separador)
+        
+        sin_cache, tiempo_sin = separar_en_grupo(lotes, args.procesos)
+        con_cache, tiempo_con = separar_en_grupo(lotes, args.procesos, cache.nombre)
+    
+    discrepancias = [
+        (palabra, obtenido, correcto)
+        for resultados in (sin_cache, con_cache)
+        for palabra, obtenido, correcto in zip(corpus, resultados, esperado) if obtenido != correcto
+    ]
+    print(f"Prueba diferencial ({len(corpus)} palabras, {precargadas} precargadas): "
+          f"{'OK' if not discrepancias else f'{len(discrepancias)} discrepancias'}")
+    for palabra, obtenido, correcto in discrepancias[:10]:
+        print(f"  {palabra!r}: trabajador={obtenido!r} dfa={correcto!r}")
+    
+    print(f"\n{'Grupo de ' + str(args.procesos) + ' procesos':<32} {'Segundos':>10} {'Palabras/s':>14}")
+    print(f"{'Sin caché':<32} {tiempo_sin:>10.3f} {len(corpus) / tiempo_sin:>14.0f}")
+    print(f"{'Con caché compartida':<32} {tiempo_con:>10.3f} {len(corpus) / tiempo_con:>14.0f}")
+    
+    sys.exit(1 if discrepancias else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Módulo: Benchmark de Concurrencia
+Descripción: Verifica que un SeparadorDFA compartido da resultados correctos bajo
+             concurrencia y mide cómo escala separar_lote con el número de hilos,
+             comparando ejecución con GIL y sin GIL cuando el intérprete lo permite
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import sysconfig
+import threading
+import time
+
+from separador_dfa import SeparadorDFA
+from utilidades import Utilidades
+
+
+def cargar_palabras(archivo, repeticiones):
+    """
+    Carga las palabras de prueba y las repite para obtener un lote grande.
+    
+    Args:
+        archivo (str): Archivo de palabras (una por línea)
+        repeticiones (int): Veces que se repite la lista
+        
+    Returns:
+        list: Palabras de prueba
+    """
+    with open(archivo, 'r', encoding='utf-8') as f:
+        palabras = [linea.strip() for linea in f if linea.strip()]
+    return palabras * repeticiones
+
+
+def prueba_estres(separador, palabras, hilos, rondas):
+    """
+    Separa el mismo lote desde muchos hilos a la vez sobre un único separador
+    y compara cada resultado con la ejecución secuencial.
+    
+    Args:
+        separador (SeparadorDFA): Separador compartido
+        palabras (list): Palabras de prueba
+        hilos (int): Hilos simultáneos
+        rondas (int): Repeticiones por hilo
+        
+    Returns:
+        int: Número de resultados distintos del esperado (0 si es correcto)
+    """
+    esperado = [separador.separar_silabas(palabra) for palabra in palabras]
+    errores = []
+    barrera = threading.Barrier(hilos)
+    
+    def trabajar(desfase):
+        barrera.wait()
+        for ronda in range(rondas):
+            # Cada hilo recorre el lote desde un punto distinto para mezclar accesos
+            inicio = (desfase * 7919 + ronda * 104729) % len(palabras)
+            for i in range(len(palabras)):
+                indice = (inicio + i) % len(palabras)
+                if separador.separar_silabas(palabras[indice]) != esperado[indice]:
+                    errores.append(indice)
+    
+    trabajadores = [threading.Thread(target=trabajar, args=(i,)) for i in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+    
+    if separador.separar_lote(palabras, hilos=hilos, tamano_bloque=64) != esperado:
+        errores.append(-1)
+    return len(errores)
+
+
+def medir_escalado(separador, palabras, lista_hilos):
+    """
+    Mide el tiempo de separar_lote para distintos números de hilos.
+    
+    Args:
+        separador (SeparadorDFA): Separador compartido
+        palabras (list): Palabras de prueba
+        lista_hilos (list): Números de hilos a medir
+        
+    Returns:
+        list: Tuplas (hilos, segundos, palabras_por_segundo)
+    """
+    mediciones = []
+    for hilos in lista_hilos:
+        inicio = time.perf_counter()
+        separador.separar_lote(palabras, hilos=hilos)
+        duracion = time.perf_counter() - inicio
+        mediciones.append((hilos, duracion, len(palabras) / duracion))
+    return mediciones
+
+
+def ejecutar(args):
+    """Ejecuta la prueba de estrés y la medición de escalado en este intérprete"""
+    separador = SeparadorDFA()
+    palabras = cargar_palabras(args.entrada, args.repeticiones)
+    nucleos = os.cpu_count() or 1
+    lista_hilos = sorted({1, 2, 4, 8, nucleos} & set(range(1, nucleos + 1)))
+    
+    print(f"Python {sys.version.split()[0]} - GIL {'activo' if Utilidades.gil_habilitado() else 'desactivado'}"
+          f" - {nucleos} nucleos - {len(palabras)} palabras")
+    
+    # La prueba de corrección no depende de los núcleos: con GIL, el
+    # entrelazado de hilos también expone condiciones de carrera
+    hilos_estres = max(8, nucleos)
+    errores = prueba_estres(separador, palabras[:5000], hilos_estres, rondas=3)
+    print(f"Prueba de estres ({hilos_estres} hilos): "
+          f"{'OK' if errores == 0 else f'FALLO ({errores} discrepancias)'}")
+    
+    base = None
+    print(f"{'Hilos':>6} {'Segundos':>10} {'Palabras/s':>12} {'Aceleracion':>12}")
+    for hilos, duracion, rendimiento in medir_escalado(separador, palabras, lista_hilos):
+        base = base or duracion
+        print(f"{hilos:>6} {duracion:>10.3f} {rendimiento:>12.0f} {base / duracion:>11.2f}x")
+    return errores
+
+
+def main():
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de concurrencia de SeparadorDFA")
+    parser.add_argument('--entrada', default='palabras_entrada.txt')
+    parser.add_argument('--repeticiones', type=int, default=500)
+    parser.add_argument('--comparar-gil', action='store_true',
+                        help="En compilaciones free-threading, repetir con PYTHON_GIL=1 y PYTHON_GIL=0")
+    args = parser.parse_args()
+    
+    if not args.comparar_gil:
+        sys.exit(1 if ejecutar(args) else 0)
+    
+    if not sysconfig.get_config_var('Py_GIL_DISABLED'):
+        print("Este intérprete no es free-threading: solo se mide la ejecución con GIL.\n")
+        sys.exit(1 if ejecutar(args) else 0)
+    
+    codigo = 0
+    for valor_gil in ('1', '0'):
+        entorno = dict(os.environ, PYTHON_GIL=valor_gil)
+        comando = [sys.executable, __file__, '--entrada', args.entrada,
+                   '--repeticiones', str(args.repeticiones)]
+        codigo |= subprocess.call(comando, env=entorno)
+        print()
+    sys.exit(codigo)
+
+
+if __name__ == "__main__":
+    main()
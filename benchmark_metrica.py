@@ -0,0 +1,84 @@
+"""
+Módulo: Benchmark de Métrica
+Descripción: Verifica el escáner métrico con versos canónicos de cómputo conocido
+             y mide su rendimiento sobre un corpus repetido
+"""
+
+import argparse
+import sys
+import time
+
+from escansion_metrica import EscanerMetrico
+
+
+# (verso, sílabas métricas) de versos conocidos que cubren sinalefa, h muda,
+# hiato por vocal débil tónica, 'y' vocal y consonántica y los tres acentos finales
+VERSOS_CANONICOS = (
+    ("Con diez cañones por banda", 8),
+    ("viento en popa a toda vela", 8),
+    ("Verde que te quiero verde", 8),
+    ("Yo soy un hombre sincero", 8),
+    ("de donde crece la palma", 8),
+    ("Caminante, no hay camino", 8),
+    ("Nuestras vidas son los ríos", 8),
+    ("que van a dar en la mar", 8),
+    ("Hombres necios que acusáis", 8),
+    ("Juventud, divino tesoro", 9),
+    ("Cuando quiero llorar, no lloro", 9),
+    ("Del salón en el ángulo oscuro", 10),
+    ("En tanto que de rosa y azucena", 11),
+    ("En tanto que de rosa y de azucena", 11),
+    ("Volverán las oscuras golondrinas", 11),
+    ("Érase un hombre a una nariz pegado", 11),
+    ("Un soneto me manda hacer Violante", 11),
+    ("La princesa está triste... ¿qué tendrá la princesa?", 14),
+    ("Puedo escribir los versos más tristes esta noche", 14),
+)
+
+
+def verificar(escaner):
+    """
+    Escande los versos canónicos y compara su cómputo con el esperado.
+    
+    Args:
+        escaner (EscanerMetrico): Escáner a verificar
+        
+    Returns:
+        list: Tuplas (verso, escansion, obtenido, esperado) de los versos que no coinciden
+    """
+    discrepancias = []
+    for verso, esperado in VERSOS_CANONICOS:
+        resultado = escaner.escandir(verso)
+        if resultado['silabas_metricas'] != esperado:
+            discrepancias.append((verso, resultado['escansion'], resultado['silabas_metricas'], esperado))
+    return discrepancias
+
+
+def main():
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(description="Verificación y benchmark del escáner métrico")
+    parser.add_argument('--repeticiones', type=int, default=5000,
+                        help="Veces que se escanden los versos canónicos en la medición")
+    args = parser.parse_args()
+    
+    escaner = EscanerMetrico()
+    
+    discrepancias = verificar(escaner)
+    print(f"Versos canónicos ({len(VERSOS_CANONICOS)}): "
+          f"{'OK' if not discrepancias else f'{len(discrepancias)} discrepancias'}")
+    for verso, escansion, obtenido, esperado in discrepancias:
+        print(f"  {verso!r}: {obtenido} sílabas ({escansion}), se esperaban {esperado}")
+    
+    versos = [verso for verso, _ in VERSOS_CANONICOS] * args.repeticiones
+    inicio = time.perf_counter()
+    for verso in versos:
+        escaner.escandir(verso)
+    duracion = time.perf_counter() - inicio
+    print(f"\nEscansión: {len(versos)} versos en {duracion:.3f} s "
+          f"({len(versos) / duracion:.0f} versos/s)")
+    
+    sys.exit(1 if discrepancias else 0)
+
+
+if __name__ == "__main__":
+    main()
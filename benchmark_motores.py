@@ -0,0 +1,93 @@
+"""
+Módulo: Benchmark de Motores
+Descripción: Compara los motores de separación silábica (autómata por tablas y
+             expresión regular sobre lotes) y verifica que producen la misma salida
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from reglas_silabicas import ReglasSilabicas
+from separador_dfa import SeparadorDFA
+from separador_regex import SeparadorRegex
+
+
+def generar_palabras_aleatorias(cantidad, semilla=0):
+    """
+    Genera cadenas aleatorias con letras del español para la prueba diferencial,
+    incluyendo mayúsculas, dígrafos y grupos consonánticos.
+    
+    Args:
+        cantidad (int): Número de palabras
+        semilla (int): Semilla del generador
+        
+    Returns:
+        list: Palabras aleatorias
+    """
+    reglas = ReglasSilabicas()
+    simbolos = (sorted(reglas.vocales) + list('bcdfghjklmnñpqrstvwxyz')
+                + list(reglas.digrafos) + list(reglas.grupos_consonanticos) + list('AÉÜ'))
+    generador = random.Random(semilla)
+    return [
+        ''.join(generador.choice(simbolos) for _ in range(generador.randint(1, 10)))
+        for _ in range(cantidad)
+    ]
+
+
+def medir(nombre, funcion, palabras):
+    """
+    Mide el rendimiento de un motor sobre un lote.
+    
+    Args:
+        nombre (str): Nombre del motor
+        funcion (callable): Recibe el lote y devuelve las separaciones
+        palabras (list): Lote de palabras
+        
+    Returns:
+        list: Separaciones producidas
+    """
+    inicio = time.perf_counter()
+    resultado = funcion(palabras)
+    duracion = time.perf_counter() - inicio
+    print(f"{nombre:<32} {duracion:>10.3f} {len(palabras) / duracion:>14.0f}")
+    return resultado
+
+
+def main():
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de motores de separación silábica")
+    parser.add_argument('--entrada', default='palabras_entrada.txt')
+    parser.add_argument('--repeticiones', type=int, default=500)
+    parser.add_argument('--aleatorias', type=int, default=50000,
+                        help="Palabras aleatorias para la prueba diferencial")
+    args = parser.parse_args()
+    
+    separador = SeparadorDFA()
+    motor_regex = SeparadorRegex(separador.reglas)
+    
+    with open(args.entrada, 'r', encoding='utf-8') as f:
+        palabras = [linea.strip() for linea in f if linea.strip()]
+    
+    # Prueba diferencial: el motor regex debe coincidir con el DFA
+    muestra = palabras + generar_palabras_aleatorias(args.aleatorias)
+    discrepancias = motor_regex.verificar_contra_dfa(muestra, separador)
+    print(f"Prueba diferencial ({len(muestra)} palabras): "
+          f"{'OK' if not discrepancias else f'{len(discrepancias)} discrepancias'}")
+    for palabra, resultado, esperado in discrepancias[:10]:
+        print(f"  {palabra!r}: regex={resultado!r} dfa={esperado!r}")
+    
+    lote = palabras * args.repeticiones
+    print(f"\n{'Motor':<32} {'Segundos':>10} {'Palabras/s':>14}")
+    medir("DFA (separar_silabas)", lambda ps: [separador.separar_silabas(p)[0] for p in ps], lote)
+    medir("DFA (solo posiciones)",
+          lambda ps: [separador.unir_silabas(separador.normalizar(p), separador.obtener_posiciones(p))
+                      for p in ps], lote)
+    medir("Regex (finditer por lote)", motor_regex.separar_lote, lote)
+    
+    sys.exit(1 if discrepancias else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Módulo: Caché Compartida
+Descripción: Tabla hash de direccionamiento abierto en memoria compartida con las
+             separaciones de las palabras más frecuentes, consultable por varios
+             procesos sin serialización ni comunicación entre procesos
+"""
+
+import multiprocessing
+import struct
+import sys
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+
+from separador_dfa import SeparadorDFA
+
+
+class CacheCompartida:
+    """
+    Caché de solo lectura (tras la precarga) de resultados de SeparadorDFA.
+    
+    Cada ranura tiene tamaño fijo y guarda la palabra normalizada en UTF-8,
+    las posiciones de separación y las reglas aplicadas como máscara de bits.
+    Las colisiones se resuelven con sondeo lineal.
+    
+    El proceso que crea la caché es el único que escribe en ella; los procesos
+    trabajadores solo la consultan.
+    """
+    
+    MAGICO = b'SSC1'
+    CABECERA = struct.Struct('<4sII')
+    RANURA = struct.Struct('<IBBB40s17s')
+    MAX_CLAVE = 40
+    MAX_CORTES = 17
+    CARGA_MAXIMA = 0.7
+    
+    def __init__(self, memoria, propietario):
+        """
+        Inicializa la caché sobre un bloque de memoria compartida existente.
+        Usar los constructores crear() o adjuntar().
+        
+        Args:
+            memoria (SharedMemory): Bloque de memoria compartida
+            propietario (bool): True si este proceso creó la caché
+        """
+        self.memoria = memoria
+        self.propietario = propietario
+        self.buffer = memoria.buf
+        
+        magico, self.num_ranuras, self.ocupadas = self.CABECERA.unpack_from(self.buffer, 0)
+        if magico != self.MAGICO:
+            raise ValueError(f"El bloque '{memoria.name}' no contiene una caché silábica")
+    
+    @classmethod
+    def crear(cls, capacidad, nombre=None):
+        """
+        Crea una caché vacía en un nuevo bloque de memoria compartida.
+        
+        Args:
+            capacidad (int): Número de palabras que se desea poder almacenar
+            nombre (str): Nombre del bloque (si es None se genera uno)
+            
+        Returns:
+            CacheCompartida: Caché propietaria del bloque
+        """
+        num_ranuras = 1
+        while num_ranuras * cls.CARGA_MAXIMA < capacidad:
+            num_ranuras *= 2
+        
+        tamano = cls.CABECERA.size + num_ranuras * cls.RANURA.size
+        memoria = shared_memory.SharedMemory(name=nombre, create=True, size=tamano)
+        memoria.buf[:tamano] = bytes(tamano)
+        cls.CABECERA.pack_into(memoria.buf, 0, cls.MAGICO, num_ranuras, 0)
+        return cls(memoria, propietario=True)
+    
+    @classmethod
+    def adjuntar(cls, nombre):
+        """
+        Abre una caché creada por otro proceso.
+        
+        Args:
+            nombre (str): Nombre del bloque de memoria compartida
+            
+        Returns:
+            CacheCompartida: Caché de solo lectura
+        """
+        if sys.version_info >= (3, 13):
+            memoria = shared_memory.SharedMemory(name=nombre, track=False)
+        else:
+            memoria = shared_memory.SharedMemory(name=nombre)
+            if multiprocessing.parent_process() is None:
+                # Un proceso independiente (no hijo de multiprocessing) tiene su
+                # propio rastreador de recursos, que borraría el bloque al terminar
+                resource_tracker.unregister(memoria._name, 'shared_memory')
+        return cls(memoria, propietario=False)
+    
+    @property
+    def nombre(self):
+        """Nombre del bloque de memoria compartida"""
+        return self.memoria.name
+    
+    @staticmethod
+    def _hash(clave):
+        """Hash estable entre procesos (nunca 0, que marca ranura vacía)"""
+        return zlib.crc32(clave) or 1
+    
+    def consultar(self, palabra):
+        """
+        Busca una palabra normalizada en la caché.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            
+        Returns:
+            tuple: (posiciones, conjunto_de_reglas) o None si no está
+        """
+        clave = palabra.encode('utf-8')
+        if len(clave) > self.MAX_CLAVE:
+            return None
+        
+        valor_hash = self._hash(clave)
+        indice = valor_hash % self.num_ranuras
+        for _ in range(self.num_ranuras):
+            desplazamiento = self.CABECERA.size + indice * self.RANURA.size
+            hash_ranura, longitud, num_cortes, mascara, clave_ranura, cortes = \
+                self.RANURA.unpack_from(self.buffer, desplazamiento)
+            
+            if hash_ranura == 0:
+                return None
+            if hash_ranura == valor_hash and clave_ranura[:longitud] == clave:
+                reglas = {regla for bit, regla in enumerate(SeparadorDFA.REGLAS) if mascara >> bit & 1}
+                return tuple(cortes[:num_cortes]), reglas
+            
+            indice = (indice + 1) % self.num_ranuras
+        return None
+    
+    def insertar(self, palabra, posiciones, reglas):
+        """
+        Inserta el resultado de una palabra (solo el proceso propietario).
+        
+        Args:
+            palabra (str): Palabra normalizada
+            posiciones (tuple): Posiciones de separación
+            reglas (set): Reglas aplicadas por el autómata
+            
+        Returns:
+            bool: True si se insertó o ya estaba, False si no cabe
+        """
+        if not self.propietario:
+            raise PermissionError("Solo el proceso que creó la caché puede escribir en ella")
+        
+        clave = palabra.encode('utf-8')
+        if len(clave) > self.MAX_CLAVE or len(posiciones) > self.MAX_CORTES:
+            return False
+        if self.ocupadas + 1 > self.num_ranuras * self.CARGA_MAXIMA:
+            return False
+        
+        valor_hash = self._hash(clave)
+        indice = valor_hash % self.num_ranuras
+        while True:
+            desplazamiento = self.CABECERA.size + indice * self.RANURA.size
+            hash_ranura, longitud, _, _, clave_ranura, _ = \
+                self.RANURA.unpack_from(self.buffer, desplazamiento)
+            if hash_ranura == 0:
+                break
+            if hash_ranura == valor_hash and clave_ranura[:longitud] == clave:
+                return True
+            indice = (indice + 1) % self.num_ranuras
+        
+        mascara = 0
+        for bit, regla in enumerate(SeparadorDFA.REGLAS):
+            if regla in reglas:
+                mascara |= 1 << bit
+        
+        # El hash se escribe al final: un lector nunca ve una ranura a medio llenar
+        self.RANURA.pack_into(
+            self.buffer, desplazamiento,
+            0, len(clave), len(posiciones), mascara, clave, bytes(posiciones)
+        )
+        struct.pack_into('<I', self.buffer, desplazamiento, valor_hash)
+        self.ocupadas += 1
+        self.CABECERA.pack_into(self.buffer, 0, self.MAGICO, self.num_ranuras, self.ocupadas)
+        return True
+    
+    def precargar(self, frecuencias, separador=None):
+        """
+        Llena la caché con las palabras más frecuentes.
+        
+        Args:
+            frecuencias (iterable): Tuplas (palabra, frecuencia) o palabras sueltas
+                                    ya ordenadas de mayor a menor frecuencia
+            separador (SeparadorDFA): Separador con el que se calculan los resultados
+            
+        Returns:
+            int: Número de palabras insertadas
+        """
+        separador = separador or SeparadorDFA()
+        insertadas = 0
+        for elemento in frecuencias:
+            palabra = elemento[0] if isinstance(elemento, tuple) else elemento
+            palabra = separador.normalizar(palabra)
+            if not palabra:
+                continue
+            
+            posiciones, reglas = separador._posiciones_normalizadas(palabra)
+            if self.insertar(palabra, posiciones, reglas):
+                insertadas += 1
+            if self.ocupadas + 1 > self.num_ranuras * self.CARGA_MAXIMA:
+                break
+        return insertadas
+    
+    def precargar_archivo(self, archivo_frecuencias, separador=None):
+        """
+        Llena la caché desde una lista de frecuencias en texto, con una palabra
+        por línea y opcionalmente su frecuencia separada por tabulador.
+        
+        Args:
+            archivo_frecuencias (str): Ruta del archivo
+            separador (SeparadorDFA): Separador con el que se calculan los resultados
+            
+        Returns:
+            int: Número de palabras insertadas
+        """
+        with open(archivo_frecuencias, 'r', encoding='utf-8') as f:
+            palabras = (linea.split('\t', 1)[0].strip() for linea in f)
+            return self.precargar(palabras, separador)
+    
+    def cerrar(self):
+        """Libera la vista de este proceso sobre la memoria compartida"""
+        self.buffer.release()
+        self.memoria.close()
+    
+    def liberar(self):
+        """Cierra y elimina el bloque de memoria compartida (solo el propietario)"""
+        self.cerrar()
+        if self.propietario:
+            self.memoria.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        if self.propietario:
+            self.liberar()
+        else:
+            self.cerrar()
+
+
+# ==================== USO DESDE PROCESOS TRABAJADORES ====================
+
+_separador_trabajador = None
+
+
+def inicializar_trabajador(nombre_cache):
+    """
+    Inicializador para multiprocessing.Pool: adjunta la caché compartida y
+    crea un separador que la consulta antes de ejecutar el autómata.
+    
+    Args:
+        nombre_cache (str): Nombre del bloque de memoria compartida
+    """
+    global _separador_trabajador
+    _separador_trabajador = SeparadorDFA(cache=CacheCompartida.adjuntar(nombre_cache))
+
+
+def separar_en_trabajador(palabras):
+    """
+    Separa un lote de palabras en un proceso trabajador.
+    
+    Args:
+        palabras (list): Lote de palabras
+        
+    Returns:
+        list: Separaciones en el mismo orden
+    """
+    separador = _separador_trabajador or SeparadorDFA()
+    # Solo posiciones: separar_silabas añadiría cuatro análisis con regex por
+    # palabra que aquí se descartan, incluso cuando la caché ya tiene el resultado
+    resultados = []
+    for palabra in palabras:
+        normalizada = separador.normalizar(palabra)
+        resultados.append(separador.unir_silabas(normalizada, separador.obtener_posiciones(normalizada)))
+    return resultados
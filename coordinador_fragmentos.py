@@ -0,0 +1,521 @@
+"""
+Módulo: Coordinador de Fragmentos
+Descripción: Reparte un archivo grande entre varios procesos trabajadores (en la
+             misma máquina o en otras) por sockets TCP y une sus resultados en orden
+"""
+
+import collections
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from cache_compartida import CacheCompartida
+from flujos_comprimidos import detectar_formato
+from procesador_archivos import ProcesadorArchivos
+from procesamiento_incremental import ProcesadorIncremental
+from separador_dfa import SeparadorDFA
+
+
+# ==================== PROTOCOLO ====================
+# Cada mensaje es una línea JSON terminada en '\n'. Si la cabecera incluye
+# 'longitud', le siguen exactamente esos bytes de datos.
+#
+#   trabajador → coordinador: {"tipo": "pedir"}
+#   coordinador → trabajador: {"tipo": "fragmento", "id", "longitud"} + líneas de entrada
+#                             {"tipo": "esperar", "segundos"}   (todo arrendado)
+#                             {"tipo": "fin"}                   (trabajo terminado)
+#   trabajador → coordinador: {"tipo": "resultado", "id", "palabras",
+#                              "longitud_tabla", "longitud"} + tabla y detalle
+#                             {"tipo": "error", "id", "mensaje"}
+#   coordinador → trabajador: {"tipo": "ok"}
+
+
+def enviar_mensaje(archivo, cabecera, datos=b''):
+    """
+    Envía un mensaje del protocolo.
+    
+    Args:
+        archivo (file): Socket abierto como archivo binario ('rwb')
+        cabecera (dict): Cabecera JSON
+        datos (bytes): Datos que siguen a la cabecera
+    """
+    if datos:
+        cabecera = dict(cabecera, longitud=len(datos))
+    archivo.write(json.dumps(cabecera).encode('utf-8') + b'\n')
+    if datos:
+        archivo.write(datos)
+    archivo.flush()
+
+
+def recibir_mensaje(archivo):
+    """
+    Recibe un mensaje del protocolo.
+    
+    Args:
+        archivo (file): Socket abierto como archivo binario ('rwb')
+        
+    Returns:
+        tuple: (cabecera, datos) o (None, b'') si la conexión se cerró
+    """
+    linea = archivo.readline()
+    if not linea:
+        return None, b''
+    cabecera = json.loads(linea)
+    longitud = cabecera.get('longitud', 0)
+    datos = archivo.read(longitud) if longitud else b''
+    if len(datos) != longitud:
+        return None, b''
+    return cabecera, datos
+
+
+def separar_direccion(direccion):
+    """
+    Interpreta una dirección 'host:puerto' (o solo 'puerto').
+    
+    Returns:
+        tuple: (host, puerto)
+    """
+    host, _, puerto = direccion.rpartition(':')
+    return host or '127.0.0.1', int(puerto)
+
+
+def dividir_en_fragmentos(archivo_entrada, tamano_fragmento):
+    """
+    Divide un archivo en rangos de bytes que empiezan y terminan en límites de línea.
+    
+    Args:
+        archivo_entrada (str): Ruta del archivo (texto plano)
+        tamano_fragmento (int): Tamaño aproximado de cada fragmento en bytes
+        
+    Returns:
+        list: Tuplas (inicio, fin) consecutivas que cubren el archivo
+    """
+    tamano = os.path.getsize(archivo_entrada)
+    fragmentos = []
+    inicio = 0
+    with open(archivo_entrada, 'rb') as f:
+        while inicio < tamano:
+            f.seek(min(inicio + tamano_fragmento, tamano))
+            f.readline()
+            fin = min(f.tell(), tamano)
+            fragmentos.append((inicio, fin))
+            inicio = fin
+    return fragmentos
+
+
+class CoordinadorFragmentos:
+    """
+    Reparte los fragmentos de un archivo entre trabajadores y une los resultados.
+    
+    Cada fragmento se arrienda a un trabajador por un tiempo limitado. Si el
+    trabajador se desconecta, informa de un error o no responde antes de que venza
+    el arriendo, el fragmento vuelve a la cola (hasta max_intentos veces). Si llegan
+    dos resultados del mismo fragmento se conserva el primero.
+    
+    Los trabajadores numeran el análisis detallado de cada fragmento desde 1; al unir
+    se renumera con ProcesadorIncremental._copiar_renumerado, así que la salida es
+    idéntica a la de ProcesadorArchivos sobre el archivo completo.
+    """
+    
+    def __init__(self, procesador=None, tamano_fragmento=4 << 20, duracion_arriendo=60.0, max_intentos=3):
+        """
+        Inicializa el coordinador.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que escribe encabezados y cierre
+            tamano_fragmento (int): Bytes aproximados por fragmento
+            duracion_arriendo (float): Segundos que un trabajador tiene para devolver un fragmento
+            max_intentos (int): Veces que se reparte un fragmento antes de abandonar el trabajo
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        self.tamano_fragmento = tamano_fragmento
+        self.duracion_arriendo = duracion_arriendo
+        self.max_intentos = max_intentos
+        
+        self.cerrojo = threading.Lock()
+        self.terminado = threading.Event()
+        self.servidor = None
+        self.error = None
+        
+        self.palabras = 0
+        self.reintentos = 0
+        self.precargadas = 0
+        self.trabajadores = set()
+        self.tiempo_total = 0.0
+    
+    def procesar_archivo(self, archivo_entrada, archivo_salida, direccion='127.0.0.1:0',
+                         trabajadores_locales=0, capacidad_cache=0):
+        """
+        Coordina el procesamiento distribuido de un archivo.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada (texto plano)
+            archivo_salida (str): Ruta del archivo de salida
+            direccion (str): 'host:puerto' donde escuchar (puerto 0 = cualquiera libre)
+            trabajadores_locales (int): Trabajadores a lanzar como subprocesos en esta máquina
+            capacidad_cache (int): Palabras más frecuentes de la entrada que se precargan en
+                                   una caché compartida con los trabajadores locales (0 = sin caché)
+                                   
+        Returns:
+            int: Número de palabras en la salida (0 si hubo un error)
+        """
+        if detectar_formato(archivo_entrada, 'r') is not None:
+            print("Error: el modo distribuido requiere una entrada sin comprimir")
+            return 0
+        if not os.path.exists(archivo_entrada):
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        
+        self.archivo_entrada = archivo_entrada
+        self.directorio = archivo_salida + '.fragmentos'
+        self.fragmentos = dividir_en_fragmentos(archivo_entrada, self.tamano_fragmento)
+        self.pendientes = collections.deque(range(len(self.fragmentos)))
+        self.arriendos = {}
+        self.intentos = [0] * len(self.fragmentos)
+        self.completados = {}
+        self.terminado.clear()
+        self.error = None
+        if not self.fragmentos:
+            self.terminado.set()
+        
+        inicio = time.perf_counter()
+        procesos = []
+        cache = None
+        try:
+            if capacidad_cache and trabajadores_locales:
+                cache = self._precargar_cache(archivo_entrada, capacidad_cache)
+            os.makedirs(self.directorio, exist_ok=True)
+            self.servidor = self._crear_servidor(direccion)
+            host, puerto = self.servidor.server_address[:2]
+            print(f"Coordinador escuchando en {host}:{puerto} ({len(self.fragmentos)} fragmentos)")
+            threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+            
+            for _ in range(trabajadores_locales):
+                procesos.append(lanzar_trabajador_local(f"{host}:{puerto}", cache.nombre if cache else None))
+            
+            while not self.terminado.wait(1.0):
+                self._recuperar_vencidos()
+            if self.error:
+                raise RuntimeError(self.error)
+            
+            self._unir_salida(archivo_salida)
+            shutil.rmtree(self.directorio, ignore_errors=True)
+        except Exception as e:
+            print(f"Error durante el procesamiento distribuido: {e}")
+            return 0
+        finally:
+            if self.servidor is not None:
+                self.servidor.shutdown()
+                self.servidor.server_close()
+            for proceso in procesos:
+                try:
+                    proceso.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proceso.kill()
+            if cache is not None:
+                cache.liberar()
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        print(f"OK - Resultados guardados en '{archivo_salida}'")
+        return self.palabras
+    
+    def _precargar_cache(self, archivo_entrada, capacidad):
+        """
+        Crea la caché compartida de los trabajadores locales y la llena con las
+        palabras más frecuentes de la entrada (contadas en memoria en una pasada).
+        
+        Returns:
+            CacheCompartida: Caché propietaria del bloque de memoria compartida
+        """
+        separador = self.procesador.separador
+        with open(archivo_entrada, 'r', encoding='utf-8') as f:
+            conteo = collections.Counter(separador.normalizar(linea) for linea in f)
+        conteo.pop('', None)
+        cache = CacheCompartida.crear(capacidad)
+        self.precargadas = cache.precargar(conteo.most_common(capacidad), separador)
+        return cache
+    
+    def _crear_servidor(self, direccion):
+        """Crea el servidor TCP que atiende a cada trabajador en su propio hilo"""
+        coordinador = self
+        
+        class Manejador(socketserver.StreamRequestHandler):
+            def handle(self):
+                coordinador._atender(self.rfile, self.wfile, self.client_address)
+        
+        class Servidor(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+        
+        return Servidor(separar_direccion(direccion), Manejador)
+    
+    def _atender(self, lectura, escritura, cliente):
+        """
+        Dialoga con un trabajador hasta que se desconecta o el trabajo termina.
+        Si se desconecta con un fragmento arrendado, el fragmento vuelve a la cola.
+        """
+        arrendado = None
+        dueno = cliente
+        try:
+            while True:
+                cabecera, datos = recibir_mensaje(lectura)
+                if cabecera is None:
+                    break
+                
+                if cabecera['tipo'] == 'pedir':
+                    with self.cerrojo:
+                        self.trabajadores.add(cabecera.get('trabajador', cliente[0]))
+                    arrendado = self._arrendar(dueno)
+                    if arrendado is None:
+                        if self.terminado.is_set():
+                            enviar_mensaje(escritura, {'tipo': 'fin'})
+                            break
+                        enviar_mensaje(escritura, {'tipo': 'esperar', 'segundos': 0.5})
+                    else:
+                        enviar_mensaje(escritura, {'tipo': 'fragmento', 'id': arrendado},
+                                       self._leer_fragmento(arrendado))
+                
+                elif cabecera['tipo'] == 'resultado':
+                    self._guardar_resultado(cabecera, datos)
+                    arrendado = None
+                    enviar_mensaje(escritura, {'tipo': 'ok'})
+                
+                elif cabecera['tipo'] == 'error':
+                    print(f"Trabajador {cliente[0]}: error en el fragmento {cabecera['id']}: "
+                          f"{cabecera.get('mensaje')}")
+                    self._devolver(cabecera['id'], dueno)
+                    arrendado = None
+        except (OSError, ValueError):
+            pass
+        finally:
+            if arrendado is not None:
+                self._devolver(arrendado, dueno)
+    
+    def _arrendar(self, dueno):
+        """
+        Entrega el siguiente fragmento pendiente.
+        
+        Args:
+            dueno (tuple): Dirección del trabajador que lo recibe
+            
+        Returns:
+            int: Identificador del fragmento o None si no hay pendientes
+        """
+        with self.cerrojo:
+            while self.pendientes:
+                indice = self.pendientes.popleft()
+                if indice not in self.completados:
+                    self.intentos[indice] += 1
+                    self.arriendos[indice] = (time.monotonic() + self.duracion_arriendo, dueno)
+                    return indice
+            return None
+    
+    def _devolver(self, indice, dueno=None):
+        """
+        Devuelve a la cola un fragmento fallido, o abandona el trabajo si agotó sus
+        intentos. Si se indica el dueño, solo se devuelve si el arriendo vigente es suyo.
+        """
+        with self.cerrojo:
+            arriendo = self.arriendos.get(indice)
+            if indice in self.completados or arriendo is None:
+                return
+            if dueno is not None and arriendo[1] != dueno:
+                return
+            del self.arriendos[indice]
+            if self.intentos[indice] >= self.max_intentos:
+                self.error = f"el fragmento {indice} falló {self.intentos[indice]} veces"
+                self.terminado.set()
+                return
+            self.reintentos += 1
+            self.pendientes.appendleft(indice)
+    
+    def _recuperar_vencidos(self):
+        """Devuelve a la cola los fragmentos cuyo arriendo venció"""
+        ahora = time.monotonic()
+        with self.cerrojo:
+            vencidos = [indice for indice, (vence, _) in self.arriendos.items() if vence < ahora]
+        for indice in vencidos:
+            self._devolver(indice)
+    
+    def _leer_fragmento(self, indice):
+        """Lee los bytes de entrada de un fragmento"""
+        inicio, fin = self.fragmentos[indice]
+        with open(self.archivo_entrada, 'rb') as f:
+            f.seek(inicio)
+            return f.read(fin - inicio)
+    
+    def _guardar_resultado(self, cabecera, datos):
+        """Guarda en disco la tabla y el detalle devueltos para un fragmento"""
+        indice = cabecera['id']
+        with self.cerrojo:
+            if indice in self.completados:
+                return
+        corte = cabecera['longitud_tabla']
+        ruta = os.path.join(self.directorio, str(indice))
+        sufijo = f".{threading.get_ident()}.tmp"
+        for extension, contenido in (('.tabla', datos[:corte]), ('.detalle', datos[corte:])):
+            with open(ruta + extension + sufijo, 'wb') as f:
+                f.write(contenido)
+            os.replace(ruta + extension + sufijo, ruta + extension)
+        
+        with self.cerrojo:
+            self.completados.setdefault(indice, cabecera['palabras'])
+            self.arriendos.pop(indice, None)
+            if len(self.completados) == len(self.fragmentos):
+                self.terminado.set()
+    
+    def _unir_salida(self, archivo_salida):
+        """Une las tablas y los detalles de los fragmentos en el orden de la entrada"""
+        procesador = self.procesador
+        carpeta, nombre = os.path.split(archivo_salida)
+        temporal = os.path.join(carpeta, '.tmp-' + nombre)
+        
+        with open(temporal, 'w', encoding='utf-8', newline='') as f:
+            procesador._escribir_encabezado(f)
+            for indice in range(len(self.fragmentos)):
+                with open(os.path.join(self.directorio, f"{indice}.tabla"),
+                          'r', encoding='utf-8', newline='') as tabla:
+                    shutil.copyfileobj(tabla, f)
+            
+            procesador._escribir_inicio_detalle(f)
+            base = 0
+            for indice in range(len(self.fragmentos)):
+                with open(os.path.join(self.directorio, f"{indice}.detalle"),
+                          'r', encoding='utf-8', newline='') as detalle:
+                    if base == 0:
+                        shutil.copyfileobj(detalle, f)
+                    else:
+                        ProcesadorIncremental._copiar_renumerado(detalle, f, base + 1)
+                base += self.completados[indice]
+            procesador._escribir_cierre(f)
+        
+        os.replace(temporal, archivo_salida)
+        self.palabras = base
+    
+    def reporte(self):
+        """
+        Resume el trabajo distribuido.
+        
+        Returns:
+            str: Fragmentos, trabajadores, reintentos y rendimiento agregado
+        """
+        velocidad = self.palabras / self.tiempo_total if self.tiempo_total else 0.0
+        return (f"Palabras: {self.palabras} - Fragmentos: {len(self.fragmentos)} - "
+                f"Trabajadores: {len(self.trabajadores)} - Reintentos: {self.reintentos} - "
+                f"Caché compartida: {self.precargadas} palabras - "
+                f"Tiempo: {self.tiempo_total:.3f} s ({velocidad:.0f} palabras/s)")
+
+
+class TrabajadorFragmentos:
+    """
+    Proceso trabajador: pide fragmentos al coordinador, los separa con
+    ProcesadorArchivos y devuelve su tabla y su análisis detallado.
+    """
+    
+    def __init__(self, procesador=None, limite_vocabulario=200000, nombre_cache=None):
+        """
+        Inicializa el trabajador.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que analiza y formatea cada palabra
+            limite_vocabulario (int): Palabras distintas que se conservan entre fragmentos
+            nombre_cache (str): Caché compartida precargada por el coordinador (opcional)
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        if nombre_cache:
+            self.procesador.separador = SeparadorDFA(cache=CacheCompartida.adjuntar(nombre_cache))
+        self.limite_vocabulario = limite_vocabulario
+        self.identificador = f"{socket.gethostname()}:{os.getpid()}"
+        self.fragmentos = 0
+        self.palabras = 0
+    
+    def ejecutar(self, direccion, intentos_conexion=20):
+        """
+        Trabaja para un coordinador hasta que no queden fragmentos.
+        
+        Args:
+            direccion (str): 'host:puerto' del coordinador
+            intentos_conexion (int): Reintentos de conexión (cada medio segundo)
+            
+        Returns:
+            int: Número de fragmentos procesados (0 si no se pudo conectar)
+        """
+        for _ in range(intentos_conexion):
+            try:
+                conexion = socket.create_connection(separar_direccion(direccion))
+                break
+            except OSError:
+                time.sleep(0.5)
+        else:
+            print(f"Error: No se pudo conectar con el coordinador en '{direccion}'")
+            return 0
+        
+        vocabulario = {}
+        with conexion, conexion.makefile('rwb') as canal:
+            while True:
+                enviar_mensaje(canal, {'tipo': 'pedir', 'trabajador': self.identificador})
+                cabecera, datos = recibir_mensaje(canal)
+                if cabecera is None or cabecera['tipo'] == 'fin':
+                    break
+                if cabecera['tipo'] == 'esperar':
+                    time.sleep(cabecera['segundos'])
+                    continue
+                
+                try:
+                    if len(vocabulario) > self.limite_vocabulario:
+                        vocabulario.clear()
+                    palabras, tabla, detalle = self._procesar_fragmento(datos, vocabulario)
+                except Exception as e:
+                    enviar_mensaje(canal, {'tipo': 'error', 'id': cabecera['id'], 'mensaje': str(e)})
+                    continue
+                
+                enviar_mensaje(canal, {'tipo': 'resultado', 'id': cabecera['id'],
+                                       'palabras': palabras, 'longitud_tabla': len(tabla)},
+                               tabla + detalle)
+                respuesta, _ = recibir_mensaje(canal)
+                if respuesta is None:
+                    break
+                self.fragmentos += 1
+                self.palabras += palabras
+        return self.fragmentos
+    
+    def _procesar_fragmento(self, datos, vocabulario):
+        """
+        Separa las palabras de un fragmento.
+        
+        Returns:
+            tuple: (palabras, tabla_bytes, detalle_bytes), con el detalle numerado desde 1
+        """
+        procesador = self.procesador
+        palabras = [palabra for palabra in (linea.strip() for linea in datos.decode('utf-8').split('\n'))
+                    if palabra]
+        filas = []
+        bloques_detalle = []
+        for numero, resultado in enumerate(procesador._procesar_palabras(palabras, vocabulario), 1):
+            filas.append(procesador._formatear_fila(resultado))
+            bloques_detalle.append(procesador._formatear_detalle(numero, resultado))
+        return len(palabras), ''.join(filas).encode('utf-8'), ''.join(bloques_detalle).encode('utf-8')
+
+
+def lanzar_trabajador_local(direccion, nombre_cache=None):
+    """
+    Lanza un trabajador como subproceso de esta máquina.
+    
+    Args:
+        direccion (str): 'host:puerto' del coordinador
+        nombre_cache (str): Caché compartida que debe adjuntar el trabajador (opcional)
+        
+    Returns:
+        subprocess.Popen: Proceso del trabajador
+    """
+    principal = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    comando = [sys.executable, principal, '--trabajador', direccion]
+    if nombre_cache:
+        comando += ['--cache-trabajador', nombre_cache]
+    return subprocess.Popen(comando, stdout=subprocess.DEVNULL)
@@ -0,0 +1,134 @@
+"""
+Módulo: Deduplicador de Palabras
+Descripción: Cuenta las palabras distintas de una entrada con ordenamiento externo
+             (archivos temporales) cuando el vocabulario no cabe en memoria
+"""
+
+import heapq
+import os
+import tempfile
+from collections import Counter
+
+
+class DeduplicadorPalabras:
+    """
+    Reduce un flujo de palabras con muchas repeticiones a su vocabulario,
+    contando la frecuencia de cada palabra normalizada.
+    
+    Mientras el vocabulario cabe en memoria se cuenta con un Counter; al superar
+    el límite, el conteo parcial se ordena y se vuelca a un archivo temporal.
+    Al final se mezclan los archivos ordenados (sort/unique externo).
+    """
+    
+    def __init__(self, normalizar, limite_memoria=200000, directorio_temporal=None):
+        """
+        Inicializa el deduplicador.
+        
+        Args:
+            normalizar (callable): Función que normaliza cada palabra
+            limite_memoria (int): Máximo de palabras distintas en memoria antes de volcar
+            directorio_temporal (str): Directorio para los archivos de volcado
+        """
+        self.normalizar = normalizar
+        self.limite_memoria = limite_memoria
+        self.directorio_temporal = directorio_temporal
+        self.total_palabras = 0
+        self.volcados = 0
+    
+    def contar(self, palabras):
+        """
+        Cuenta las palabras distintas de un iterable.
+        
+        Args:
+            palabras (iterable): Palabras de entrada (se consumen una sola vez)
+        
+        Returns:
+            iterator: Tuplas (palabra_normalizada, frecuencia) en orden alfabético
+        """
+        conteo = Counter()
+        volcados = []
+        self.total_palabras = 0
+        
+        try:
+            for palabra in palabras:
+                clave = self.normalizar(palabra)
+                if not clave:
+                    continue
+                conteo[clave] += 1
+                self.total_palabras += 1
+                
+                if len(conteo) >= self.limite_memoria:
+                    volcados.append(self._volcar(conteo))
+                    conteo = Counter()
+        except BaseException:
+            self._eliminar(volcados)
+            raise
+        
+        self.volcados = len(volcados)
+        if not volcados:
+            return iter(sorted(conteo.items()))
+        
+        if conteo:
+            volcados.append(self._volcar(conteo))
+        return self._mezclar(volcados)
+    
+    def _volcar(self, conteo):
+        """
+        Escribe un conteo parcial ordenado en un archivo temporal.
+        
+        Args:
+            conteo (Counter): Conteo parcial
+        
+        Returns:
+            str: Ruta del archivo temporal
+        """
+        descriptor, ruta = tempfile.mkstemp(
+            prefix='dedup_', suffix='.txt', dir=self.directorio_temporal
+        )
+        with open(descriptor, 'w', encoding='utf-8') as f:
+            for palabra, frecuencia in sorted(conteo.items()):
+                f.write(f"{palabra}\t{frecuencia}\n")
+        return ruta
+    
+    def _mezclar(self, volcados):
+        """
+        Mezcla los volcados ordenados sumando las frecuencias de claves iguales.
+        
+        Args:
+            volcados (list): Rutas de los archivos temporales
+        
+        Yields:
+            tuple: (palabra_normalizada, frecuencia)
+        """
+        archivos = [open(ruta, 'r', encoding='utf-8') for ruta in volcados]
+        try:
+            flujos = [map(self._leer_linea, f) for f in archivos]
+            actual, acumulado = None, 0
+            for palabra, frecuencia in heapq.merge(*flujos):
+                if palabra == actual:
+                    acumulado += frecuencia
+                    continue
+                if actual is not None:
+                    yield actual, acumulado
+                actual, acumulado = palabra, frecuencia
+            if actual is not None:
+                yield actual, acumulado
+        finally:
+            for f in archivos:
+                f.close()
+            self._eliminar(volcados)
+    
+    @staticmethod
+    def _leer_linea(linea):
+        """Convierte una línea 'palabra<TAB>frecuencia' en tupla"""
+        palabra, frecuencia = linea.rstrip('\n').rsplit('\t', 1)
+        return palabra, int(frecuencia)
+    
+    @staticmethod
+    def _eliminar(volcados):
+        """Elimina los archivos temporales de volcado"""
+        for ruta in volcados:
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
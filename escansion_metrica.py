@@ -0,0 +1,268 @@
+"""
+Módulo: Escansión Métrica
+Descripción: Cuenta las sílabas métricas de versos en español aplicando sinalefa
+             entre palabras y el ajuste por acento final del verso
+"""
+
+import re
+import time
+
+from flujos_comprimidos import abrir_texto
+from separador_dfa import SeparadorDFA
+
+
+class AnalisisPalabra:
+    """
+    Datos de una palabra necesarios para la escansión (se calculan una vez por palabra).
+    """
+    
+    __slots__ = ('silabas', 'tonica', 'vocal_inicial', 'vocal_final')
+    
+    def __init__(self, silabas, tonica, vocal_inicial, vocal_final):
+        """
+        Args:
+            silabas (tuple): Sílabas gramaticales de la palabra normalizada
+            tonica (int): Posición de la sílaba tónica contando desde el final
+                          (1 = aguda, 2 = llana, 3 = esdrújula, ...)
+            vocal_inicial (str): Vocal con la que empieza (tras h muda) o None
+            vocal_final (str): Vocal en la que termina o None
+        """
+        self.silabas = silabas
+        self.tonica = tonica
+        self.vocal_inicial = vocal_inicial
+        self.vocal_final = vocal_final
+
+
+class EscanerMetrico:
+    """
+    Escande versos línea a línea.
+    
+    Cada palabra se separa con el autómata y se guarda en caché junto con su
+    acentuación y sus vocales de borde. En el verso:
+    - Sinalefa: la vocal final de una palabra y la inicial de la siguiente (también
+      tras h muda) forman una sola sílaba métrica, salvo que una de ellas sea una
+      vocal débil acentuada, que impone hiato (ReglasSilabicas.es_diptongo)
+    - La conjunción 'y' es vocal salvo ante vocal, donde suena como consonante y
+      se une a la sílaba siguiente sin sinalefa (ro-sa-ya-zu-ce-na)
+    - Acento final: se suma una sílaba si la última palabra es aguda (o monosílaba)
+      y se resta una si es esdrújula o sobresdrújula
+    """
+    
+    patron_palabra = re.compile(r'[^\W\d_]+')
+    
+    AJUSTE_ACENTO = {1: 1, 2: 0}
+    NOMBRE_ACENTO = {1: 'aguda', 2: 'llana', 3: 'esdrújula'}
+    
+    def __init__(self, separador=None, tamano_cache=100000):
+        """
+        Inicializa el escáner.
+        
+        Args:
+            separador (SeparadorDFA): Separador silábico a usar
+            tamano_cache (int): Palabras distintas que se conservan en caché
+        """
+        self.separador = separador or SeparadorDFA()
+        self.reglas = self.separador.reglas
+        self.tamano_cache = tamano_cache
+        self.cache = {}
+        
+        self.versos = 0
+        self.palabras = 0
+        self.aciertos_cache = 0
+        self.tiempo_total = 0.0
+    
+    # ==================== ANÁLISIS POR PALABRA ====================
+    
+    def analizar_palabra(self, palabra):
+        """
+        Obtiene (de la caché o calculándolo) el análisis de una palabra normalizada.
+        
+        Args:
+            palabra (str): Palabra normalizada, no vacía
+            
+        Returns:
+            AnalisisPalabra: Sílabas, acentuación y vocales de borde
+        """
+        analisis = self.cache.get(palabra)
+        if analisis is not None:
+            self.aciertos_cache += 1
+            return analisis
+        
+        posiciones = self.separador.obtener_posiciones(palabra)
+        limites = (0,) + posiciones + (len(palabra),)
+        silabas = tuple(palabra[limites[i]:limites[i + 1]] for i in range(len(limites) - 1))
+        analisis = AnalisisPalabra(
+            silabas,
+            self._silaba_tonica(palabra, silabas),
+            self._vocal_inicial(palabra),
+            self._vocal_final(palabra),
+        )
+        
+        if len(self.cache) >= self.tamano_cache:
+            self.cache.clear()
+        self.cache[palabra] = analisis
+        return analisis
+    
+    def _silaba_tonica(self, palabra, silabas):
+        """
+        Determina la sílaba tónica contando desde el final: la que lleva tilde o,
+        sin tilde, la penúltima si la palabra termina en vocal, n o s y la última
+        en otro caso. Los monosílabos se consideran agudos.
+        """
+        for desde_final, silaba in enumerate(reversed(silabas), 1):
+            if any(self.reglas.tiene_acento(c) for c in silaba):
+                return desde_final
+        if len(silabas) > 1 and (self.reglas.es_vocal(palabra[-1]) or palabra[-1] in 'ns'):
+            return 2
+        return 1
+    
+    def _vocal_inicial(self, palabra):
+        """
+        Vocal que abre la palabra a efectos de sinalefa. La h inicial es muda,
+        pero 'hi' y 'hu' ante vocal (hielo, hueso) suenan como consonante.
+        La conjunción 'y' cuenta como vocal (ante vocal la trata escandir).
+        """
+        if palabra == 'y':
+            return 'i'
+        if palabra[0] == 'h':
+            palabra = palabra[1:]
+            if len(palabra) > 1 and palabra[0] in 'iu' and self.reglas.es_vocal(palabra[1]):
+                return None
+        if palabra and self.reglas.es_vocal(palabra[0]):
+            return palabra[0]
+        return None
+    
+    def _vocal_final(self, palabra):
+        """
+        Vocal que cierra la palabra a efectos de sinalefa. La conjunción 'y'
+        suena como 'i'; la 'y' final tras vocal (hoy, muy) pasa a ser consonante
+        ante la vocal siguiente (so-yun), así que no forma sinalefa.
+        """
+        if palabra == 'y':
+            return 'i'
+        if self.reglas.es_vocal(palabra[-1]):
+            return palabra[-1]
+        return None
+    
+    def _hay_sinalefa(self, vocal_final, vocal_inicial):
+        """
+        Decide si dos vocales en contacto entre palabras se unen en una sílaba.
+        Dos vocales fuertes sí forman sinalefa; una vocal débil acentuada impone hiato.
+        """
+        if vocal_final is None or vocal_inicial is None:
+            return False
+        if self.reglas.es_diptongo(vocal_final, vocal_inicial):
+            return True
+        return self.reglas.es_vocal_fuerte(vocal_final) and self.reglas.es_vocal_fuerte(vocal_inicial)
+    
+    # ==================== ESCANSIÓN ====================
+    
+    def escandir(self, verso):
+        """
+        Escande un verso.
+        
+        Args:
+            verso (str): Verso original
+            
+        Returns:
+            dict: Diccionario con:
+                - verso: texto original
+                - escansion: sílabas métricas unidas con '-' (sinalefa marcada con '_')
+                - silabas_gramaticales: suma de las sílabas de cada palabra
+                - sinalefas: número de sinalefas aplicadas
+                - acentuacion: tipo de la última palabra (aguda, llana o esdrújula)
+                - silabas_metricas: cómputo final del verso
+        """
+        palabras = self.patron_palabra.findall(self.reglas.normalizar_lote(verso))
+        self.versos += 1
+        self.palabras += len(palabras)
+        if not palabras:
+            return {'verso': verso, 'escansion': '', 'silabas_gramaticales': 0,
+                    'sinalefas': 0, 'acentuacion': None, 'silabas_metricas': 0}
+        
+        analisis_palabras = [self.analizar_palabra(palabra) for palabra in palabras]
+        metricas = []
+        sinalefas = 0
+        vocal_final = None
+        consonante = ''
+        for i, analisis in enumerate(analisis_palabras):
+            if (palabras[i] == 'y' and i + 1 < len(analisis_palabras)
+                    and analisis_palabras[i + 1].vocal_inicial is not None):
+                # 'y' ante vocal: consonante de la primera sílaba siguiente
+                consonante = 'y'
+                vocal_final = None
+                continue
+            silabas = list(analisis.silabas)
+            if metricas and self._hay_sinalefa(vocal_final, analisis.vocal_inicial):
+                metricas[-1] += '_' + silabas.pop(0)
+                sinalefas += 1
+            elif consonante:
+                silabas[0] = consonante + silabas[0]
+            consonante = ''
+            metricas.extend(silabas)
+            vocal_final = analisis.vocal_final
+        
+        tonica = analisis.tonica
+        ajuste = self.AJUSTE_ACENTO.get(tonica, -1)
+        return {
+            'verso': verso,
+            'escansion': '-'.join(metricas),
+            'silabas_gramaticales': sum(len(analisis.silabas) for analisis in analisis_palabras),
+            'sinalefas': sinalefas,
+            'acentuacion': self.NOMBRE_ACENTO.get(tonica, 'esdrújula'),
+            'silabas_metricas': len(metricas) + ajuste,
+        }
+    
+    def escandir_archivo(self, archivo_entrada, archivo_salida):
+        """
+        Escande un corpus de versos (uno por línea) en streaming, escribiendo por
+        verso su cómputo métrico, su escansión y el texto original separados por
+        tabuladores. Las líneas vacías se conservan como separación de estrofas.
+        
+        Args:
+            archivo_entrada (str): Ruta del corpus (puede estar comprimido)
+            archivo_salida (str): Ruta del archivo de salida (puede comprimirse)
+            
+        Returns:
+            int: Número de versos escandidos (0 si hubo un error)
+        """
+        self.versos = self.palabras = self.aciertos_cache = 0
+        inicio = time.perf_counter()
+        try:
+            with abrir_texto(archivo_entrada, 'r') as entrada, \
+                    abrir_texto(archivo_salida, 'w') as salida:
+                filas = []
+                for linea in entrada:
+                    verso = linea.strip()
+                    if not verso:
+                        filas.append('\n')
+                        continue
+                    resultado = self.escandir(verso)
+                    filas.append(f"{resultado['silabas_metricas']}\t{resultado['escansion']}\t{verso}\n")
+                    if len(filas) >= 1000:
+                        salida.write(''.join(filas))
+                        filas = []
+                salida.write(''.join(filas))
+        except FileNotFoundError:
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        except Exception as e:
+            print(f"Error al escandir el archivo: {e}")
+            return 0
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        print(f"OK - Escansión guardada en '{archivo_salida}'")
+        return self.versos
+    
+    def reporte(self):
+        """
+        Resume el rendimiento de la última escansión de archivo.
+        
+        Returns:
+            str: Versos, palabras, velocidad y aciertos de caché
+        """
+        tiempo = self.tiempo_total or float('inf')
+        aciertos = 100.0 * self.aciertos_cache / self.palabras if self.palabras else 0.0
+        return (f"Versos: {self.versos} ({self.versos / tiempo:.0f} versos/s) - "
+                f"Palabras: {self.palabras} ({self.palabras / tiempo:.0f} palabras/s) - "
+                f"Aciertos de caché: {aciertos:.1f}% - Tiempo: {self.tiempo_total:.3f} s")
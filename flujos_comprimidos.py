@@ -0,0 +1,505 @@
+"""
+Módulo: Flujos Comprimidos
+Descripción: Apertura transparente de archivos de texto .gz, .bz2, .xz y .zst para
+             lectura y escritura en streaming, con descompresión paralela de
+             entradas formadas por varios miembros/bloques y compresión de la
+             salida en un hilo aparte
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+
+# Firmas (bytes mágicos) de cada formato
+FIRMAS = {
+    'gz': b'\x1f\x8b',
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+    'zst': b'\x28\xb5\x2f\xfd',
+}
+
+EXTENSIONES = {
+    '.gz': 'gz', '.gzip': 'gz',
+    '.bz2': 'bz2',
+    '.xz': 'xz', '.lzma': 'xz',
+    '.zst': 'zst', '.zstd': 'zst',
+}
+
+# Tamaño de los bloques que se pasan entre hilos
+TAMANO_BLOQUE = 1 << 20
+
+# Inicio de cada flujo bz2: 'BZh', nivel y firma del primer bloque (pi en BCD)
+_INICIO_FLUJO_BZ2 = re.compile(rb'BZh[1-9]\x31\x41\x59\x26\x53\x59')
+_FIRMA_ZSTD_OMITIBLE = range(0x184D2A50, 0x184D2A60)
+
+
+def detectar_formato(ruta, modo='r'):
+    """
+    Determina el formato de compresión de un archivo.
+    
+    Al leer se usan los bytes mágicos (con la extensión como respaldo);
+    al escribir, solo la extensión.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        modo (str): 'r' para lectura, 'w'/'a' para escritura
+        
+    Returns:
+        str: 'gz', 'bz2', 'xz', 'zst' o None si es texto plano
+    """
+    por_extension = EXTENSIONES.get(os.path.splitext(ruta)[1].lower())
+    if modo != 'r' or not os.path.exists(ruta):
+        return por_extension
+    
+    with open(ruta, 'rb') as f:
+        cabecera = f.read(6)
+    for formato, firma in FIRMAS.items():
+        if cabecera.startswith(firma):
+            return formato
+    return por_extension if not cabecera else None
+
+
+def abrir_texto(ruta, modo='r', hilos=None):
+    """
+    Abre un archivo de texto UTF-8, comprimido o no, para lectura o escritura.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        modo (str): 'r' (lectura) o 'w' (escritura)
+        hilos (int): Hilos para descomprimir en paralelo (por defecto, núcleos)
+        
+    Returns:
+        io.TextIOBase: Flujo de texto; debe cerrarse (admite 'with')
+    """
+    formato = detectar_formato(ruta, modo)
+    if formato is None:
+        return open(ruta, modo, encoding='utf-8')
+    
+    if formato == 'zst' and zstd is None:
+        raise ValueError(f"El formato zstd requiere Python 3.14 (compression.zstd): '{ruta}'")
+    
+    if modo == 'r':
+        return io.TextIOWrapper(abrir_binario(ruta, hilos), encoding='utf-8')
+    
+    crudo = EscritorComprimido(ruta, formato)
+    return io.TextIOWrapper(io.BufferedWriter(crudo, TAMANO_BLOQUE), encoding='utf-8')
+
+
+def abrir_binario(ruta, hilos=None):
+    """
+    Abre un archivo para leer sus bytes ya descomprimidos.
+    
+    Args:
+        ruta (str): Ruta del archivo
+        hilos (int): Hilos para descomprimir en paralelo (por defecto, núcleos)
+        
+    Returns:
+        io.BufferedIOBase: Flujo binario; solo los archivos sin comprimir admiten seek
+    """
+    formato = detectar_formato(ruta, 'r')
+    if formato is None:
+        return open(ruta, 'rb')
+    
+    if formato == 'zst' and zstd is None:
+        raise ValueError(f"El formato zstd requiere Python 3.14 (compression.zstd): '{ruta}'")
+    
+    crudo = _abrir_lectura(ruta, formato, hilos or os.cpu_count() or 1)
+    return io.BufferedReader(crudo, TAMANO_BLOQUE)
+
+
+def _abrir_lectura(ruta, formato, hilos):
+    """Elige el lector paralelo si el archivo tiene varios segmentos independientes"""
+    if hilos > 1:
+        try:
+            segmentos = SEGMENTADORES[formato](ruta)
+        except (OSError, IndexError, struct.error):
+            segmentos = None
+        if segmentos is not None and len(segmentos) > 1:
+            return LectorParalelo(ruta, formato, segmentos, hilos)
+    return LectorEnSegundoPlano(ruta, formato)
+
+
+# ==================== DETECCIÓN DE SEGMENTOS INDEPENDIENTES ====================
+
+def _segmentos_bgzf(ruta):
+    """
+    Lista los miembros de un gzip por bloques (BGZF, como el de bgzip), cuyo
+    campo extra 'BC' indica el tamaño comprimido de cada miembro.
+    
+    Returns:
+        list: Tuplas (desplazamiento, tamaño) o None si no es BGZF
+    """
+    segmentos = []
+    tamano_archivo = os.path.getsize(ruta)
+    with open(ruta, 'rb') as f:
+        desplazamiento = 0
+        while desplazamiento < tamano_archivo:
+            f.seek(desplazamiento)
+            cabecera = f.read(12)
+            if len(cabecera) < 12 or cabecera[:2] != FIRMAS['gz'] or not cabecera[3] & 0x04:
+                return None
+            
+            longitud_extra = struct.unpack('<H', cabecera[10:12])[0]
+            extra = f.read(longitud_extra)
+            tamano_bloque = None
+            i = 0
+            while i + 4 <= len(extra):
+                id_campo, longitud = extra[i:i + 2], struct.unpack('<H', extra[i + 2:i + 4])[0]
+                if id_campo == b'BC' and longitud == 2:
+                    tamano_bloque = struct.unpack('<H', extra[i + 4:i + 6])[0] + 1
+                i += 4 + longitud
+            if tamano_bloque is None:
+                return None
+            
+            segmentos.append((desplazamiento, tamano_bloque))
+            desplazamiento += tamano_bloque
+    return segmentos
+
+
+def _segmentos_bz2(ruta):
+    """
+    Lista los flujos concatenados de un bz2 (como el de pbzip2) buscando la
+    firma de inicio de flujo.
+    
+    Returns:
+        list: Tuplas (desplazamiento, tamaño) o None si no hay firma al inicio
+    """
+    tamano_archivo = os.path.getsize(ruta)
+    if tamano_archivo == 0:
+        return None
+    with open(ruta, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        inicios = [m.start() for m in _INICIO_FLUJO_BZ2.finditer(datos)]
+    if not inicios or inicios[0] != 0:
+        return None
+    limites = inicios + [tamano_archivo]
+    return [(limites[i], limites[i + 1] - limites[i]) for i in range(len(inicios))]
+
+
+def _segmentos_zstd(ruta):
+    """
+    Lista los frames de un zstd recorriendo sus cabeceras de bloque.
+    
+    Returns:
+        list: Tuplas (desplazamiento, tamaño) o None si la estructura no es válida
+    """
+    segmentos = []
+    tamano_archivo = os.path.getsize(ruta)
+    with open(ruta, 'rb') as f:
+        desplazamiento = 0
+        while desplazamiento < tamano_archivo:
+            f.seek(desplazamiento)
+            magico = struct.unpack('<I', f.read(4).ljust(4, b'\0'))[0]
+            
+            if magico in _FIRMA_ZSTD_OMITIBLE:
+                longitud = struct.unpack('<I', f.read(4))[0]
+                desplazamiento += 8 + longitud
+                continue
+            if magico != 0xFD2FB528:
+                return None
+            
+            descriptor = f.read(1)[0]
+            tamano_contenido = (0, 2, 4, 8)[descriptor >> 6]
+            segmento_unico = descriptor >> 5 & 1
+            con_checksum = descriptor >> 2 & 1
+            tamano_diccionario = (0, 1, 2, 4)[descriptor & 3]
+            if segmento_unico and tamano_contenido == 0:
+                tamano_contenido = 1
+            cabecera = 5 + (0 if segmento_unico else 1) + tamano_diccionario + tamano_contenido
+            
+            posicion = desplazamiento + cabecera
+            ultimo = False
+            while not ultimo:
+                f.seek(posicion)
+                datos_bloque = f.read(3)
+                if len(datos_bloque) < 3:
+                    return None
+                valor = int.from_bytes(datos_bloque, 'little')
+                ultimo = valor & 1
+                tipo = valor >> 1 & 3
+                tamano = valor >> 3
+                posicion += 3 + (1 if tipo == 1 else tamano)
+            posicion += 4 if con_checksum else 0
+            
+            segmentos.append((desplazamiento, posicion - desplazamiento))
+            desplazamiento = posicion
+    return segmentos
+
+
+SEGMENTADORES = {
+    'gz': _segmentos_bgzf,
+    'bz2': _segmentos_bz2,
+    'xz': lambda ruta: None,
+    'zst': _segmentos_zstd,
+}
+
+
+def _descomprimir(formato, datos):
+    """Descomprime un grupo de segmentos independientes consecutivos"""
+    if formato == 'gz':
+        return gzip.decompress(datos)
+    if formato == 'bz2':
+        return bz2.decompress(datos)
+    if formato == 'zst':
+        return zstd.decompress(datos)
+    return lzma.decompress(datos)
+
+
+def _abrir_binario(ruta, formato):
+    """Abre un flujo binario descomprimido secuencial"""
+    if formato == 'gz':
+        return gzip.open(ruta, 'rb')
+    if formato == 'bz2':
+        return bz2.open(ruta, 'rb')
+    if formato == 'xz':
+        return lzma.open(ruta, 'rb')
+    return zstd.open(ruta, 'rb')
+
+
+# ==================== LECTORES ====================
+
+class _LectorPorBloques(io.RawIOBase):
+    """
+    Flujo binario de solo lectura que entrega, en orden, los bloques
+    descomprimidos que producen otros hilos.
+    """
+    
+    def __init__(self):
+        """Inicializa el lector sin ningún bloque pendiente"""
+        super().__init__()
+        self._bloque = memoryview(b'')
+        self._agotado = False
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, destino):
+        """Copia en destino los siguientes bytes descomprimidos"""
+        while not self._bloque and not self._agotado:
+            bloque = self._siguiente_bloque()
+            if bloque is None:
+                self._agotado = True
+            else:
+                self._bloque = memoryview(bloque)
+        
+        cantidad = min(len(destino), len(self._bloque))
+        destino[:cantidad] = self._bloque[:cantidad]
+        self._bloque = self._bloque[cantidad:]
+        return cantidad
+    
+    def _siguiente_bloque(self):
+        """Devuelve el siguiente bloque de bytes o None al terminar"""
+        raise NotImplementedError
+
+
+class LectorEnSegundoPlano(_LectorPorBloques):
+    """
+    Descomprime secuencialmente en un hilo aparte, de modo que la
+    descompresión se solapa con la separación silábica.
+    """
+    
+    def __init__(self, ruta, formato, capacidad_cola=8):
+        """
+        Inicia el hilo de descompresión.
+        
+        Args:
+            ruta (str): Ruta del archivo comprimido
+            formato (str): Formato detectado
+            capacidad_cola (int): Bloques descomprimidos en espera como máximo
+        """
+        super().__init__()
+        self._cola = queue.Queue(capacidad_cola)
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._descomprimir, args=(ruta, formato), daemon=True)
+        self._hilo.start()
+    
+    def _descomprimir(self, ruta, formato):
+        """Hilo productor: lee el flujo descomprimido por bloques"""
+        try:
+            with _abrir_binario(ruta, formato) as f:
+                while not self._detener.is_set():
+                    bloque = f.read(TAMANO_BLOQUE)
+                    if not bloque:
+                        break
+                    self._poner(bloque)
+            self._poner(None)
+        except Exception as e:
+            self._poner(e)
+    
+    def _poner(self, elemento):
+        """Encola un elemento salvo que el lector se haya cerrado"""
+        while not self._detener.is_set():
+            try:
+                self._cola.put(elemento, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _siguiente_bloque(self):
+        elemento = self._cola.get()
+        if isinstance(elemento, Exception):
+            raise elemento
+        return elemento
+    
+    def close(self):
+        self._detener.set()
+        super().close()
+
+
+class LectorParalelo(_LectorPorBloques):
+    """
+    Descomprime en paralelo los segmentos independientes de un archivo
+    (miembros BGZF, flujos bz2 concatenados o frames zstd) y los entrega en
+    orden. zlib, bz2, lzma y zstd liberan el GIL mientras descomprimen.
+    """
+    
+    def __init__(self, ruta, formato, segmentos, hilos):
+        """
+        Inicia la descompresión de los primeros grupos de segmentos.
+        
+        Args:
+            ruta (str): Ruta del archivo comprimido
+            formato (str): Formato detectado
+            segmentos (list): Tuplas (desplazamiento, tamaño) de cada segmento
+            hilos (int): Hilos de descompresión
+        """
+        super().__init__()
+        self._ruta = ruta
+        self._formato = formato
+        self._grupos = self._agrupar(segmentos)
+        self._grupo_siguiente = 0
+        self._grupo_hilos = ThreadPoolExecutor(max_workers=hilos)
+        self._pendientes = []
+        self._ventana = hilos * 2
+        self._llenar_ventana()
+    
+    @staticmethod
+    def _agrupar(segmentos):
+        """Une segmentos contiguos hasta reunir al menos TAMANO_BLOQUE comprimido"""
+        grupos = []
+        inicio, tamano = None, 0
+        for desplazamiento, longitud in segmentos:
+            if inicio is None:
+                inicio = desplazamiento
+            tamano = desplazamiento + longitud - inicio
+            if tamano >= TAMANO_BLOQUE:
+                grupos.append((inicio, tamano))
+                inicio = None
+        if inicio is not None:
+            grupos.append((inicio, tamano))
+        return grupos
+    
+    def _descomprimir_grupo(self, inicio, tamano):
+        """Lee y descomprime un grupo de segmentos en un hilo del grupo"""
+        with open(self._ruta, 'rb') as f:
+            f.seek(inicio)
+            datos = f.read(tamano)
+        return _descomprimir(self._formato, datos)
+    
+    def _llenar_ventana(self):
+        """Mantiene en marcha hasta 'ventana' grupos por delante del consumidor"""
+        while len(self._pendientes) < self._ventana and self._grupo_siguiente < len(self._grupos):
+            inicio, tamano = self._grupos[self._grupo_siguiente]
+            self._pendientes.append(self._grupo_hilos.submit(self._descomprimir_grupo, inicio, tamano))
+            self._grupo_siguiente += 1
+    
+    def _siguiente_bloque(self):
+        if not self._pendientes:
+            return None
+        bloque = self._pendientes.pop(0).result()
+        self._llenar_ventana()
+        return bloque
+    
+    def close(self):
+        for pendiente in self._pendientes:
+            pendiente.cancel()
+        self._grupo_hilos.shutdown(wait=False)
+        super().close()
+
+
+# ==================== ESCRITOR ====================
+
+class EscritorComprimido(io.RawIOBase):
+    """
+    Flujo binario de escritura que comprime en un hilo aparte: quien escribe
+    solo encola los bytes y continúa con la separación silábica.
+    """
+    
+    def __init__(self, ruta, formato, capacidad_cola=8):
+        """
+        Abre el archivo de salida e inicia el hilo de compresión.
+        
+        Args:
+            ruta (str): Ruta del archivo de salida
+            formato (str): Formato de compresión
+            capacidad_cola (int): Bloques pendientes de comprimir como máximo
+        """
+        super().__init__()
+        self._archivo = open(ruta, 'wb')
+        self._compresor = self._crear_compresor(formato)
+        self._cola = queue.Queue(capacidad_cola)
+        self._error = None
+        self._hilo = threading.Thread(target=self._comprimir, daemon=True)
+        self._hilo.start()
+    
+    @staticmethod
+    def _crear_compresor(formato):
+        """Crea el compresor incremental del formato indicado"""
+        if formato == 'gz':
+            return zlib.compressobj(6, zlib.DEFLATED, 31)
+        if formato == 'bz2':
+            return bz2.BZ2Compressor()
+        if formato == 'xz':
+            return lzma.LZMACompressor()
+        return zstd.ZstdCompressor()
+    
+    def _comprimir(self):
+        """Hilo consumidor: comprime y escribe los bloques encolados"""
+        try:
+            while True:
+                bloque = self._cola.get()
+                if bloque is None:
+                    break
+                self._archivo.write(self._compresor.compress(bloque))
+            self._archivo.write(self._compresor.flush())
+        except Exception as e:
+            self._error = e
+            # Seguir vaciando la cola para no bloquear al productor
+            while self._cola.get() is not None:
+                pass
+    
+    def writable(self):
+        return True
+    
+    def write(self, datos):
+        """Encola una copia de los bytes para comprimirlos en segundo plano"""
+        if self._error is not None:
+            raise self._error
+        self._cola.put(bytes(datos))
+        return len(datos)
+    
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()
+            self._cola.put(None)
+            self._hilo.join()
+        finally:
+            self._archivo.close()
+        if self._error is not None:
+            raise self._error
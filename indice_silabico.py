@@ -0,0 +1,423 @@
+"""
+Módulo: Índice Silábico
+Descripción: Índice invertido de sílabas sobre un corpus, con identificadores enteros
+             por sílaba, listas de palabras comprimidas por diferencias (VByte) y un
+             formato binario que se abre con mmap sin deserializar
+"""
+
+import bisect
+import itertools
+import mmap
+import struct
+import sys
+from array import array
+from collections import Counter
+
+from flujos_comprimidos import abrir_texto
+from separador_dfa import SeparadorDFA
+
+
+class IndiceSilabico:
+    """
+    Índice de sílabas de un vocabulario.
+    
+    Las palabras distintas y las sílabas se ordenan por sus bytes UTF-8, de modo
+    que su identificador es su posición y se buscan por bisección sin diccionarios.
+    Se guarda, en arreglos de enteros de 32 bits:
+    - secuencia de identificadores de sílaba de cada palabra
+    - apariciones de cada palabra en el corpus y de cada sílaba (frecuencias)
+    y, como diferencias entre identificadores codificadas en VByte (7 bits por
+    byte, el bit alto marca que el número sigue en el byte siguiente):
+    - por sílaba, las palabras que la contienen
+    - por sílaba, las palabras que terminan en ella (rima)
+    Los offsets de estas dos listas son posiciones en bytes.
+    
+    El archivo guardado es la misma representación en memoria, así que cargarlo
+    solo requiere mapear el archivo.
+    """
+    
+    MAGICO = b'SILIDX2\0'
+    VERSION = 2
+    CABECERA = struct.Struct('<8sIII')
+    SECCION = struct.Struct('<QQ')
+    SECCIONES = (
+        'texto_palabras', 'offsets_palabras',
+        'texto_silabas', 'offsets_silabas',
+        'secuencias', 'offsets_secuencias',
+        'postings', 'offsets_postings',
+        'rimas', 'offsets_rimas',
+        'frecuencias_palabras', 'frecuencias_silabas',
+    )
+    SECCIONES_BYTES = ('texto_palabras', 'texto_silabas', 'postings', 'rimas')
+    
+    def __init__(self, datos):
+        """
+        Abre un índice a partir de su representación binaria.
+        Usar construir() o cargar().
+        
+        Args:
+            datos (bytes | mmap.mmap): Contenido del índice
+        """
+        self._datos = datos
+        vista = memoryview(datos)
+        magico, _, self.num_palabras, self.num_silabas = self.CABECERA.unpack_from(vista, 0)
+        if magico != self.MAGICO:
+            raise ValueError("El archivo no es un índice silábico")
+        
+        posicion = self.CABECERA.size
+        for nombre in self.SECCIONES:
+            inicio, longitud = self.SECCION.unpack_from(vista, posicion)
+            posicion += self.SECCION.size
+            seccion = vista[inicio:inicio + longitud]
+            if nombre not in self.SECCIONES_BYTES:
+                seccion = self._enteros(seccion)
+            setattr(self, '_' + nombre, seccion)
+    
+    @staticmethod
+    def _enteros(seccion):
+        """Interpreta una sección como enteros sin signo de 32 bits little-endian"""
+        if sys.byteorder == 'little':
+            return seccion.cast('I')
+        enteros = array('I', seccion)
+        enteros.byteswap()
+        return memoryview(enteros)
+    
+    # ==================== CONSTRUCCIÓN ====================
+    
+    @classmethod
+    def construir(cls, palabras, separador=None):
+        """
+        Construye el índice de un conjunto de palabras.
+        
+        Args:
+            palabras (iterable): Palabras del corpus (se normalizan, se cuentan y se deduplican)
+            separador (SeparadorDFA): Separador a usar
+            
+        Returns:
+            IndiceSilabico: Índice en memoria
+        """
+        separador = separador or SeparadorDFA()
+        
+        apariciones = Counter(filter(None, map(separador.normalizar, palabras)))
+        vocabulario = {}
+        for normalizada in apariciones:
+            posiciones = separador.obtener_posiciones(normalizada)
+            limites = (0,) + posiciones + (len(normalizada),)
+            vocabulario[normalizada] = [
+                normalizada[limites[i]:limites[i + 1]] for i in range(len(limites) - 1)
+            ]
+        
+        lista_palabras = sorted(vocabulario, key=lambda p: p.encode('utf-8'))
+        lista_silabas = sorted({s for silabas in vocabulario.values() for s in silabas},
+                               key=lambda s: s.encode('utf-8'))
+        id_silaba = {silaba: i for i, silaba in enumerate(lista_silabas)}
+        
+        secuencias, offsets_secuencias = array('I'), array('I', [0])
+        frecuencias_palabras = array('I')
+        frecuencias_silabas = array('I', bytes(4 * len(lista_silabas)))
+        postings = [[] for _ in lista_silabas]
+        rimas = [[] for _ in lista_silabas]
+        for id_palabra, palabra in enumerate(lista_palabras):
+            ids = [id_silaba[s] for s in vocabulario[palabra]]
+            secuencias.extend(ids)
+            offsets_secuencias.append(len(secuencias))
+            frecuencias_palabras.append(apariciones[palabra])
+            for id_s in ids:
+                frecuencias_silabas[id_s] += apariciones[palabra]
+            for id_s in dict.fromkeys(ids):
+                postings[id_s].append(id_palabra)
+            rimas[ids[-1]].append(id_palabra)
+        
+        secciones = {}
+        secciones['texto_palabras'], secciones['offsets_palabras'] = cls._empaquetar_textos(lista_palabras)
+        secciones['texto_silabas'], secciones['offsets_silabas'] = cls._empaquetar_textos(lista_silabas)
+        secciones['secuencias'] = secuencias
+        secciones['offsets_secuencias'] = offsets_secuencias
+        secciones['postings'], secciones['offsets_postings'] = cls._empaquetar_diferencias(postings)
+        secciones['rimas'], secciones['offsets_rimas'] = cls._empaquetar_diferencias(rimas)
+        secciones['frecuencias_palabras'] = frecuencias_palabras
+        secciones['frecuencias_silabas'] = frecuencias_silabas
+        
+        return cls(cls._serializar(len(lista_palabras), len(lista_silabas), secciones))
+    
+    @staticmethod
+    def _empaquetar_textos(textos):
+        """Concatena textos UTF-8 y registra dónde empieza cada uno"""
+        codificados = [texto.encode('utf-8') for texto in textos]
+        offsets = array('I', [0])
+        offsets.extend(itertools.accumulate(len(c) for c in codificados))
+        return b''.join(codificados), offsets
+    
+    @staticmethod
+    def _empaquetar_diferencias(listas):
+        """
+        Codifica cada lista creciente de identificadores como diferencias sucesivas
+        en VByte y registra en qué byte empieza cada lista.
+        """
+        valores, offsets = bytearray(), array('I', [0])
+        for lista in listas:
+            anterior = 0
+            for valor in lista:
+                diferencia = valor - anterior
+                anterior = valor
+                while diferencia >= 0x80:
+                    valores.append(diferencia & 0x7f | 0x80)
+                    diferencia >>= 7
+                valores.append(diferencia)
+            offsets.append(len(valores))
+        return bytes(valores), offsets
+    
+    @classmethod
+    def _serializar(cls, num_palabras, num_silabas, secciones):
+        """
+        Genera la representación binaria: cabecera, tabla de secciones y las
+        secciones alineadas a 8 bytes en little-endian.
+        
+        Returns:
+            bytes: Contenido del índice
+        """
+        posicion = cls.CABECERA.size + cls.SECCION.size * len(cls.SECCIONES)
+        tabla = []
+        cuerpos = []
+        for nombre in cls.SECCIONES:
+            contenido = secciones[nombre]
+            if isinstance(contenido, array):
+                if sys.byteorder != 'little':
+                    contenido = array('I', contenido)
+                    contenido.byteswap()
+                contenido = contenido.tobytes()
+            relleno = -posicion % 8
+            cuerpos.append(b'\0' * relleno + contenido)
+            posicion += relleno
+            tabla.append(cls.SECCION.pack(posicion, len(contenido)))
+            posicion += len(contenido)
+        
+        cabecera = cls.CABECERA.pack(cls.MAGICO, cls.VERSION, num_palabras, num_silabas)
+        return cabecera + b''.join(tabla) + b''.join(cuerpos)
+    
+    @classmethod
+    def construir_desde_archivo(cls, archivo, separador=None):
+        """
+        Construye el índice de las palabras de un archivo (una por línea).
+        
+        Args:
+            archivo (str): Ruta del archivo (puede estar comprimido)
+            separador (SeparadorDFA): Separador a usar
+            
+        Returns:
+            IndiceSilabico: Índice en memoria
+        """
+        with abrir_texto(archivo, 'r') as f:
+            return cls.construir((linea.strip() for linea in f), separador)
+    
+    # ==================== PERSISTENCIA ====================
+    
+    def guardar(self, ruta):
+        """
+        Guarda el índice en disco.
+        
+        Args:
+            ruta (str): Ruta del archivo de índice
+        """
+        with open(ruta, 'wb') as f:
+            f.write(self._datos)
+    
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Abre un índice guardado mapeándolo en memoria (sin leerlo completo).
+        
+        Args:
+            ruta (str): Ruta del archivo de índice
+            
+        Returns:
+            IndiceSilabico: Índice de solo lectura respaldado por el archivo
+        """
+        with open(ruta, 'rb') as f:
+            datos = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(datos)
+    
+    # ==================== CONSULTAS ====================
+    
+    def _texto(self, textos, offsets, indice):
+        """Decodifica el texto número 'indice' de una tabla de textos"""
+        return str(textos[offsets[indice]:offsets[indice + 1]], 'utf-8')
+    
+    def _buscar(self, textos, offsets, cantidad, texto):
+        """Busca un texto por bisección en una tabla ordenada por bytes"""
+        clave = texto.encode('utf-8')
+        indice = bisect.bisect_left(
+            range(cantidad), clave,
+            key=lambda i: textos[offsets[i]:offsets[i + 1]].tobytes()
+        )
+        if indice < cantidad and textos[offsets[indice]:offsets[indice + 1]] == clave:
+            return indice
+        return None
+    
+    def palabra(self, id_palabra):
+        """Devuelve la palabra con el identificador indicado"""
+        return self._texto(self._texto_palabras, self._offsets_palabras, id_palabra)
+    
+    def silaba(self, id_silaba):
+        """Devuelve la sílaba con el identificador indicado"""
+        return self._texto(self._texto_silabas, self._offsets_silabas, id_silaba)
+    
+    def id_palabra(self, palabra):
+        """Identificador de una palabra normalizada (None si no está)"""
+        return self._buscar(self._texto_palabras, self._offsets_palabras, self.num_palabras, palabra)
+    
+    def id_silaba(self, silaba):
+        """Identificador de una sílaba (None si no está)"""
+        return self._buscar(self._texto_silabas, self._offsets_silabas, self.num_silabas, silaba)
+    
+    def _ids_secuencia(self, id_palabra):
+        """Identificadores de sílaba de una palabra, en orden"""
+        return self._secuencias[self._offsets_secuencias[id_palabra]:self._offsets_secuencias[id_palabra + 1]]
+    
+    def _decodificar(self, valores, offsets, id_silaba):
+        """Reconstruye los identificadores de palabra de una lista de diferencias en VByte"""
+        actual = diferencia = desplazamiento = 0
+        for byte in valores[offsets[id_silaba]:offsets[id_silaba + 1]]:
+            diferencia |= (byte & 0x7f) << desplazamiento
+            if byte & 0x80:
+                desplazamiento += 7
+                continue
+            actual += diferencia
+            yield actual
+            diferencia = desplazamiento = 0
+    
+    def silabas_de(self, palabra):
+        """
+        Obtiene las sílabas de una palabra del índice.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            
+        Returns:
+            list: Sílabas en orden (vacía si la palabra no está)
+        """
+        id_palabra = self.id_palabra(palabra)
+        if id_palabra is None:
+            return []
+        return [self.silaba(i) for i in self._ids_secuencia(id_palabra)]
+    
+    def buscar_silaba(self, silaba):
+        """
+        Palabras que contienen la sílaba en cualquier posición.
+        
+        Args:
+            silaba (str): Sílaba buscada
+            
+        Returns:
+            list: Palabras en orden alfabético (por bytes)
+        """
+        id_silaba = self.id_silaba(silaba)
+        if id_silaba is None:
+            return []
+        return [self.palabra(i) for i in self._decodificar(self._postings, self._offsets_postings, id_silaba)]
+    
+    def buscar_rima(self, silaba):
+        """
+        Palabras cuya última sílaba es la indicada.
+        
+        Args:
+            silaba (str): Sílaba final
+            
+        Returns:
+            list: Palabras en orden alfabético (por bytes)
+        """
+        id_silaba = self.id_silaba(silaba)
+        if id_silaba is None:
+            return []
+        return [self.palabra(i) for i in self._decodificar(self._rimas, self._offsets_rimas, id_silaba)]
+    
+    def rimas_de(self, palabra):
+        """
+        Palabras con la misma sílaba final que una palabra del índice.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            
+        Returns:
+            list: Palabras que riman (incluida la propia palabra)
+        """
+        silabas = self.silabas_de(palabra)
+        return self.buscar_rima(silabas[-1]) if silabas else []
+    
+    def buscar_posicion(self, silaba, posicion):
+        """
+        Palabras que tienen la sílaba en una posición concreta.
+        
+        Args:
+            silaba (str): Sílaba buscada
+            posicion (int): Índice de la sílaba (0 = primera, -1 = última)
+            
+        Returns:
+            list: Palabras en orden alfabético (por bytes)
+        """
+        id_silaba = self.id_silaba(silaba)
+        if id_silaba is None:
+            return []
+        if posicion == -1:
+            return self.buscar_rima(silaba)
+        
+        resultado = []
+        for id_palabra in self._decodificar(self._postings, self._offsets_postings, id_silaba):
+            secuencia = self._ids_secuencia(id_palabra)
+            if -len(secuencia) <= posicion < len(secuencia) and secuencia[posicion] == id_silaba:
+                resultado.append(self.palabra(id_palabra))
+        return resultado
+    
+    def frecuencia_silaba(self, silaba):
+        """
+        Apariciones de la sílaba en el corpus: cada aparición de cada palabra
+        cuenta, y también las repeticiones dentro de una palabra (pa-pa suma 2).
+        
+        Args:
+            silaba (str): Sílaba buscada
+            
+        Returns:
+            int: Número de apariciones (0 si no está)
+        """
+        id_silaba = self.id_silaba(silaba)
+        if id_silaba is None:
+            return 0
+        return self._frecuencias_silabas[id_silaba]
+    
+    def frecuencia_palabra(self, palabra):
+        """
+        Apariciones de una palabra en el corpus.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            
+        Returns:
+            int: Número de apariciones (0 si no está)
+        """
+        id_palabra = self.id_palabra(palabra)
+        if id_palabra is None:
+            return 0
+        return self._frecuencias_palabras[id_palabra]
+    
+    def palabras_con_silaba(self, silaba):
+        """
+        Número de palabras distintas que contienen la sílaba.
+        
+        Args:
+            silaba (str): Sílaba buscada
+            
+        Returns:
+            int: Tamaño de su lista de palabras (un byte sin el bit alto por palabra)
+        """
+        id_silaba = self.id_silaba(silaba)
+        if id_silaba is None:
+            return 0
+        inicio, fin = self._offsets_postings[id_silaba], self._offsets_postings[id_silaba + 1]
+        return sum(byte < 0x80 for byte in self._postings[inicio:fin])
+    
+    def cerrar(self):
+        """Libera el archivo mapeado, si el índice se cargó desde disco"""
+        for nombre in self.SECCIONES:
+            getattr(self, '_' + nombre).release()
+        if isinstance(self._datos, mmap.mmap):
+            self._datos.close()
@@ -0,0 +1,311 @@
+"""
+Módulo: Justificador de Párrafos
+Descripción: Justifica párrafos a un ancho fijo eligiendo los cortes de línea de
+             forma óptima (al estilo Knuth-Plass) con división silábica por guion
+"""
+
+import bisect
+import re
+import time
+import unicodedata
+
+from flujos_comprimidos import abrir_texto
+from separador_dfa import SeparadorDFA
+
+
+class JustificadorParrafos:
+    """
+    Divide párrafos en líneas de ancho fijo (texto monoespaciado) minimizando la
+    suma de deméritos de todas las líneas del párrafo, no línea a línea.
+    
+    El párrafo se convierte en piezas: palabras completas o, si admiten división,
+    sus fragmentos entre puntos de corte silábicos (obtener_puntos_division). Tras
+    cada pieza hay un corte posible: un espacio al final de palabra o un guion
+    dentro de ella. Para cada corte se busca el mejor corte anterior entre los que
+    dan una línea que cabe en el ancho y no supera la tolerancia de estiramiento
+    (el primero se localiza por bisección); así el trabajo por párrafo es lineal
+    en su número de piezas, con un factor acotado por el ancho de línea.
+    
+    Deméritos de una línea (salvo la última, que no se estira):
+    - (1 + 100 * (espacio_sobrante / huecos)^3)^2
+    - más penalizacion_guion^2 si termina en guion
+    - más penalizacion_guiones_seguidos si la línea anterior también terminó en guion
+    
+    Los puntos de corte de cada palabra se guardan en caché.
+    """
+    
+    patron_nucleo = re.compile(r'^(\W*)([^\W\d_]+)(\W*)$')
+    
+    def __init__(self, ancho=72, separador=None, penalizacion_guion=50,
+                 penalizacion_guiones_seguidos=3000, tolerancia=3.0, tamano_cache=200000):
+        """
+        Inicializa el justificador.
+        
+        Args:
+            ancho (int): Caracteres por línea
+            separador (SeparadorDFA): Separador que da los puntos de división
+            penalizacion_guion (int): Penalización por cortar una palabra
+            penalizacion_guiones_seguidos (int): Demérito extra por dos guiones consecutivos
+            tolerancia (float): Espacios extra por hueco a partir de los cuales no se prueban
+                                líneas más cortas (se prueba al menos la más larga que cabe)
+            tamano_cache (int): Palabras distintas cuyos puntos de corte se conservan
+        """
+        self.ancho = ancho
+        self.separador = separador or SeparadorDFA()
+        self.penalizacion_guion = penalizacion_guion
+        self.penalizacion_guiones_seguidos = penalizacion_guiones_seguidos
+        self.tolerancia = tolerancia
+        self.tamano_cache = tamano_cache
+        self.cache = {}
+        
+        self.parrafos = 0
+        self.palabras = 0
+        self.lineas = 0
+        self.aciertos_cache = 0
+        self.tiempo_total = 0.0
+        self.tiempo_maximo_parrafo = 0.0
+    
+    # ==================== PUNTOS DE CORTE ====================
+    
+    def puntos_division(self, palabra):
+        """
+        Obtiene (de la caché o calculándolos) los puntos de corte de una palabra
+        que puede llevar signos de puntuación pegados al principio o al final.
+        
+        Args:
+            palabra (str): Palabra tal como aparece en el texto
+            
+        Returns:
+            tuple: Desplazamientos sobre la palabra en los que puede cortarse
+        """
+        puntos = self.cache.get(palabra)
+        if puntos is not None:
+            self.aciertos_cache += 1
+            return puntos
+        
+        coincidencia = self.patron_nucleo.match(palabra)
+        if coincidencia is None:
+            puntos = ()
+        else:
+            inicio = len(coincidencia.group(1))
+            puntos = tuple(inicio + pos for pos in self.separador.obtener_puntos_division(coincidencia.group(2)))
+        
+        if len(self.cache) >= self.tamano_cache:
+            self.cache.clear()
+        self.cache[palabra] = puntos
+        return puntos
+    
+    def _piezas(self, palabras):
+        """
+        Convierte las palabras del párrafo en piezas con su tipo de corte.
+        
+        Returns:
+            tuple: (textos, fin_de_palabra) por pieza
+        """
+        textos = []
+        fin_de_palabra = []
+        for palabra in palabras:
+            inicio = 0
+            for pos in self.puntos_division(palabra):
+                textos.append(palabra[inicio:pos])
+                fin_de_palabra.append(False)
+                inicio = pos
+            textos.append(palabra[inicio:])
+            fin_de_palabra.append(True)
+        return textos, fin_de_palabra
+    
+    # ==================== JUSTIFICACIÓN ====================
+    
+    def justificar(self, parrafo):
+        """
+        Justifica un párrafo.
+        
+        Args:
+            parrafo (str): Texto del párrafo (los saltos de línea cuentan como espacios)
+            
+        Returns:
+            list: Líneas justificadas en NFC (la última alineada a la izquierda)
+        """
+        # En NFC las letras con tilde de un texto en NFD son un solo carácter
+        # y el patrón de palabra (que no admite marcas combinantes) las reconoce
+        palabras = unicodedata.normalize('NFC', parrafo.replace('\u00ad', '')).split()
+        self.parrafos += 1
+        self.palabras += len(palabras)
+        if not palabras:
+            return []
+        
+        textos, fin_de_palabra = self._piezas(palabras)
+        cortes = self._elegir_cortes(textos, fin_de_palabra)
+        lineas = self._componer_lineas(textos, fin_de_palabra, cortes)
+        self.lineas += len(lineas)
+        return lineas
+    
+    def _elegir_cortes(self, textos, fin_de_palabra):
+        """
+        Programación dinámica sobre los cortes posibles del párrafo.
+        
+        Args:
+            textos (list): Texto de cada pieza
+            fin_de_palabra (list): Si tras cada pieza el corte es un espacio (True) o un guion
+            
+        Returns:
+            list: Índices (excluyentes) de las piezas donde termina cada línea
+        """
+        ancho = self.ancho
+        tolerancia = self.tolerancia
+        guion = self.penalizacion_guion ** 2
+        guiones_seguidos = self.penalizacion_guiones_seguidos
+        total = len(textos)
+        
+        # Acumulados: espacios entre palabras y ancho ocupado (piezas + espacios)
+        espacios = [0] * (total + 1)
+        ocupado = [0] * (total + 1)
+        for i, texto in enumerate(textos):
+            espacios[i + 1] = espacios[i] + fin_de_palabra[i]
+            ocupado[i + 1] = ocupado[i] + len(texto) + fin_de_palabra[i]
+        
+        infinito = float('inf')
+        demeritos = [infinito] * (total + 1)
+        anterior = [0] * (total + 1)
+        demeritos[0] = 0.0
+        
+        for fin in range(1, total + 1):
+            ultima = fin == total
+            con_guion = not fin_de_palabra[fin - 1]
+            # Longitud de la línea [inicio, fin): ocupado[fin] - ocupado[inicio] + ajuste
+            # (sin el espacio final, con el guion si lo hay)
+            ajuste = 1 if con_guion else -1
+            huecos_fin = espacios[fin - 1]
+            
+            # Primer inicio con el que la línea cabe (al menos una pieza por línea);
+            # a partir de ahí las líneas son cada vez más cortas y más estiradas
+            inicio = bisect.bisect_left(ocupado, ocupado[fin] + ajuste - ancho, 0, fin - 1)
+            mejor = infinito
+            while inicio < fin:
+                huecos = huecos_fin - espacios[inicio]
+                if ultima:
+                    costo = 0.0
+                else:
+                    sobrante = ancho - (ocupado[fin] - ocupado[inicio] + ajuste)
+                    if sobrante < 0:
+                        sobrante = 0
+                    proporcion = sobrante / huecos if huecos else (10.0 if sobrante else 0.0)
+                    costo = (1 + 100 * proporcion * proporcion * proporcion) ** 2
+                    if con_guion:
+                        costo += guion
+                if con_guion and inicio and not fin_de_palabra[inicio - 1]:
+                    costo += guiones_seguidos
+                
+                candidato = demeritos[inicio] + costo
+                if candidato < mejor:
+                    mejor = candidato
+                    anterior[fin] = inicio
+                if not ultima and proporcion > tolerancia:
+                    break
+                inicio += 1
+            demeritos[fin] = mejor
+        
+        cortes = []
+        fin = total
+        while fin:
+            cortes.append(fin)
+            fin = anterior[fin]
+        return cortes[::-1]
+    
+    def _componer_lineas(self, textos, fin_de_palabra, cortes):
+        """
+        Construye el texto de cada línea repartiendo el espacio sobrante entre los
+        huecos (los primeros reciben el resto).
+        
+        Returns:
+            list: Líneas del párrafo
+        """
+        lineas = []
+        inicio = 0
+        for numero, fin in enumerate(cortes):
+            palabras = []
+            actual = ''
+            for i in range(inicio, fin):
+                actual += textos[i]
+                if fin_de_palabra[i]:
+                    palabras.append(actual)
+                    actual = ''
+            if actual:
+                palabras.append(actual + '-')
+            inicio = fin
+            
+            if numero == len(cortes) - 1 or len(palabras) == 1:
+                lineas.append(' '.join(palabras))
+                continue
+            huecos = len(palabras) - 1
+            sobrante = max(self.ancho - sum(len(p) for p in palabras), huecos)
+            base, resto = divmod(sobrante, huecos)
+            partes = []
+            for i, palabra in enumerate(palabras[:-1]):
+                partes.append(palabra + ' ' * (base + (i < resto)))
+            partes.append(palabras[-1])
+            lineas.append(''.join(partes))
+        return lineas
+    
+    def justificar_archivo(self, archivo_entrada, archivo_salida):
+        """
+        Justifica un texto en streaming, párrafo a párrafo (separados por líneas vacías).
+        
+        Args:
+            archivo_entrada (str): Ruta del texto (puede estar comprimido)
+            archivo_salida (str): Ruta del texto justificado (puede comprimirse)
+            
+        Returns:
+            int: Número de párrafos justificados (0 si hubo un error)
+        """
+        self.parrafos = self.palabras = self.lineas = self.aciertos_cache = 0
+        self.tiempo_maximo_parrafo = 0.0
+        inicio = time.perf_counter()
+        try:
+            with abrir_texto(archivo_entrada, 'r') as entrada, \
+                    abrir_texto(archivo_salida, 'w') as salida:
+                parrafo = []
+                primero = True
+                for linea in entrada:
+                    if linea.strip():
+                        parrafo.append(linea)
+                        continue
+                    if parrafo:
+                        primero = self._escribir_parrafo(salida, parrafo, primero)
+                        parrafo = []
+                if parrafo:
+                    self._escribir_parrafo(salida, parrafo, primero)
+        except FileNotFoundError:
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        except Exception as e:
+            print(f"Error al justificar el archivo: {e}")
+            return 0
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        print(f"OK - Texto justificado guardado en '{archivo_salida}'")
+        return self.parrafos
+    
+    def _escribir_parrafo(self, salida, lineas, primero):
+        """Justifica un párrafo, lo escribe (separado del anterior) y mide su tiempo"""
+        inicio = time.perf_counter()
+        justificadas = self.justificar(''.join(lineas))
+        self.tiempo_maximo_parrafo = max(self.tiempo_maximo_parrafo, time.perf_counter() - inicio)
+        if not primero:
+            salida.write('\n')
+        salida.write('\n'.join(justificadas) + '\n')
+        return False
+    
+    def reporte(self):
+        """
+        Resume el rendimiento de la última justificación de archivo.
+        
+        Returns:
+            str: Párrafos, palabras, velocidad, tiempo máximo por párrafo y aciertos de caché
+        """
+        tiempo = self.tiempo_total or float('inf')
+        aciertos = 100.0 * self.aciertos_cache / self.palabras if self.palabras else 0.0
+        return (f"Párrafos: {self.parrafos} - Líneas: {self.lineas} - "
+                f"Palabras: {self.palabras} ({self.palabras / tiempo:.0f} palabras/s) - "
+                f"Máximo por párrafo: {1000.0 * self.tiempo_maximo_parrafo:.2f} ms - "
+                f"Aciertos de caché: {aciertos:.1f}%")
@@ -1,30 +1,141 @@
 
+import argparse
+
+from coordinador_fragmentos import CoordinadorFragmentos, TrabajadorFragmentos
+from escansion_metrica import EscanerMetrico
+from indice_silabico import IndiceSilabico
+from justificador_parrafos import JustificadorParrafos
+from pipeline_procesamiento import PipelineProcesamiento
 from procesador_archivos import ProcesadorArchivos
+from procesamiento_incremental import ProcesadorIncremental
+from procesamiento_reanudable import ProcesadorReanudable
+from seguimiento_archivo import SeguidorArchivo
 from utilidades import Utilidades
 
 
-def main():
+def crear_parser():
+    """Define los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Separador silábico basado en DFA")
+    # Modos de procesamiento: solo uno por ejecución (--resume acompaña a --checkpoint)
+    modos = parser.add_mutually_exclusive_group()
+    parser.add_argument('--entrada', default='palabras_entrada.txt',
+                        help="Archivo de palabras de entrada")
+    parser.add_argument('--salida', default='tokens_salida.txt',
+                        help="Archivo de salida")
+    modos.add_argument('--frecuencias', action='store_true',
+                       help="Generar un resumen por palabra distinta ponderado por frecuencia")
+    modos.add_argument('--pipeline', action='store_true',
+                       help="Leer, separar y escribir en etapas concurrentes con colas acotadas")
+    parser.add_argument('--lote', type=int, default=1000,
+                        help="Palabras por lote en los modos pipeline, checkpoint y seguir")
+    parser.add_argument('--hilos', type=int, default=None,
+                        help="Hilos de separación en modo pipeline")
+    modos.add_argument('--checkpoint', type=float, metavar='SEGUNDOS', default=None,
+                       help="Guardar puntos de control cada SEGUNDOS para poder reanudar")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reanudar desde el último punto de control consistente")
+    modos.add_argument('--incremental', action='store_true',
+                       help="Reprocesar solo los fragmentos de la entrada que cambiaron")
+    modos.add_argument('--indice', metavar='RUTA', default=None,
+                       help="Construir el índice silábico de la entrada y guardarlo en RUTA")
+    modos.add_argument('--metrica', action='store_true',
+                       help="Escandir la entrada como versos (uno por línea) y contar sílabas métricas")
+    modos.add_argument('--seguir', action='store_true',
+                       help="Seguir la entrada y procesar las líneas que se le añadan (Ctrl+C para terminar)")
+    modos.add_argument('--justificar', type=int, metavar='ANCHO', default=None,
+                       help="Justificar la entrada (párrafos separados por líneas vacías) a ANCHO columnas")
+    modos.add_argument('--coordinar', metavar='HOST:PUERTO', default=None,
+                       help="Repartir la entrada en fragmentos entre trabajadores conectados a esta dirección")
+    modos.add_argument('--trabajador', metavar='HOST:PUERTO', default=None,
+                       help="Trabajar para el coordinador en esa dirección")
+    parser.add_argument('--trabajadores-locales', type=int, default=0,
+                        help="Trabajadores a lanzar en esta máquina en modo coordinador")
+    parser.add_argument('--fragmento', type=int, metavar='BYTES', default=4 << 20,
+                        help="Tamaño aproximado de cada fragmento en modo coordinador")
+    parser.add_argument('--cache-compartida', type=int, metavar='PALABRAS', default=0,
+                        help="Precargar las PALABRAS más frecuentes en una caché compartida "
+                             "con los trabajadores locales en modo coordinador")
+    parser.add_argument('--cache-trabajador', metavar='NOMBRE', default=None,
+                        help="Caché compartida que adjunta un trabajador local (la indica el coordinador)")
+    return parser
+
+
+def main(argv=None):
     """Función principal del programa"""
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    otro_modo = (args.frecuencias or args.pipeline or args.incremental or args.indice or args.metrica
+                 or args.seguir or args.justificar or args.coordinar or args.trabajador)
+    if args.resume and otro_modo:
+        parser.error("--resume solo puede combinarse con --checkpoint")
+    
+    # Un trabajador solo atiende al coordinador: no usa archivos locales
+    if args.trabajador:
+        TrabajadorFragmentos(nombre_cache=args.cache_trabajador).ejecutar(args.trabajador)
+        return
     
     # Mostrar encabezado
     Utilidades.mostrar_encabezado()
     
-    # Crear archivo de entrada si no existe
-    archivo_entrada = 'palabras_entrada.txt'
-    if not Utilidades.archivo_existe(archivo_entrada):
+    # Crear archivo de entrada si no existe (solo en el modo por defecto: en los
+    # demás modos la entrada es un dato real, p. ej. un log que aún no existe)
+    archivo_entrada = args.entrada
+    modo_por_defecto = not (otro_modo or args.checkpoint is not None or args.resume)
+    if modo_por_defecto and not Utilidades.archivo_existe(archivo_entrada):
         print("Creando archivo de entrada con palabras de ejemplo...")
         Utilidades.crear_archivo_entrada(archivo_entrada)
         print()
     
     # Procesar archivo
-    archivo_salida = 'tokens_salida.txt'
+    archivo_salida = args.salida
     procesador = ProcesadorArchivos()
     
-    resultados = procesador.procesar_archivo(archivo_entrada, archivo_salida)
-    
-    # Mostrar resultados en consola
-    if resultados:
-        procesador.mostrar_resultados_consola(resultados)
+    if args.frecuencias:
+        procesador.procesar_frecuencias(archivo_entrada, archivo_salida)
+    elif args.coordinar:
+        coordinador = CoordinadorFragmentos(procesador, tamano_fragmento=args.fragmento)
+        if coordinador.procesar_archivo(archivo_entrada, archivo_salida, args.coordinar,
+                                        trabajadores_locales=args.trabajadores_locales,
+                                        capacidad_cache=args.cache_compartida):
+            print(coordinador.reporte())
+    elif args.seguir:
+        seguidor = SeguidorArchivo(procesador, tamano_lote=args.lote)
+        print(f"Siguiendo '{archivo_entrada}' (Ctrl+C para terminar)...")
+        if seguidor.seguir(archivo_entrada, archivo_salida):
+            print(seguidor.reporte())
+    elif args.justificar:
+        justificador = JustificadorParrafos(args.justificar, procesador.separador)
+        if justificador.justificar_archivo(archivo_entrada, archivo_salida):
+            print(justificador.reporte())
+    elif args.metrica:
+        escaner = EscanerMetrico(procesador.separador)
+        if escaner.escandir_archivo(archivo_entrada, archivo_salida):
+            print(escaner.reporte())
+    elif args.indice:
+        indice = IndiceSilabico.construir_desde_archivo(archivo_entrada, procesador.separador)
+        indice.guardar(args.indice)
+        print(f"OK - Índice de {indice.num_palabras} palabras y {indice.num_silabas} "
+              f"sílabas guardado en '{args.indice}'")
+    elif args.incremental:
+        incremental = ProcesadorIncremental(procesador)
+        if incremental.procesar_archivo(archivo_entrada, archivo_salida):
+            print(incremental.reporte())
+    elif args.checkpoint is not None or args.resume:
+        reanudable = ProcesadorReanudable(procesador, tamano_lote=args.lote,
+                                          intervalo=args.checkpoint or 10.0)
+        if reanudable.procesar_archivo(archivo_entrada, archivo_salida, reanudar=args.resume):
+            print(reanudable.reporte())
+    elif args.pipeline:
+        pipeline = PipelineProcesamiento(procesador, tamano_lote=args.lote,
+                                         hilos_separacion=args.hilos)
+        if pipeline.procesar_archivo(archivo_entrada, archivo_salida):
+            print(pipeline.reporte())
+    else:
+        resultados = procesador.procesar_archivo(archivo_entrada, archivo_salida)
+        
+        # Mostrar resultados en consola
+        if resultados:
+            procesador.mostrar_resultados_consola(resultados)
     
     # Mostrar pie
     Utilidades.mostrar_pie()
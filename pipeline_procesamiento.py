@@ -0,0 +1,293 @@
+"""
+Módulo: Pipeline de Procesamiento
+Descripción: Procesa un archivo en etapas concurrentes (lectura, separación y
+             escritura) conectadas por colas acotadas, con estadísticas por etapa
+"""
+
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+from flujos_comprimidos import abrir_texto
+from procesador_archivos import ProcesadorArchivos
+from utilidades import Utilidades
+
+
+# Marca de fin de datos en las colas
+_FIN = None
+
+
+class EstadisticasEtapa:
+    """
+    Acumula el trabajo realizado por una etapa del pipeline y la ocupación
+    de su cola de entrada.
+    """
+    
+    def __init__(self, nombre):
+        """
+        Inicializa las estadísticas de una etapa.
+        
+        Args:
+            nombre (str): Nombre de la etapa
+        """
+        self.nombre = nombre
+        self.elementos = 0
+        self.lotes = 0
+        self.tiempo_activo = 0.0
+        self.muestras_cola = 0
+        self.suma_cola = 0
+        self.maximo_cola = 0
+        self._candado = threading.Lock()
+    
+    def registrar(self, elementos, duracion, profundidad_cola=None):
+        """
+        Registra un lote procesado por la etapa.
+        
+        Args:
+            elementos (int): Palabras del lote
+            duracion (float): Segundos de trabajo efectivo
+            profundidad_cola (int): Elementos en la cola de entrada al tomar el lote
+        """
+        with self._candado:
+            self.elementos += elementos
+            self.lotes += 1
+            self.tiempo_activo += duracion
+            if profundidad_cola is not None:
+                self.muestras_cola += 1
+                self.suma_cola += profundidad_cola
+                self.maximo_cola = max(self.maximo_cola, profundidad_cola)
+    
+    @property
+    def rendimiento(self):
+        """Palabras por segundo de trabajo efectivo"""
+        return self.elementos / self.tiempo_activo if self.tiempo_activo else 0.0
+    
+    @property
+    def cola_promedio(self):
+        """Profundidad media de la cola de entrada"""
+        return self.suma_cola / self.muestras_cola if self.muestras_cola else 0.0
+
+
+class PipelineProcesamiento:
+    """
+    Ejecuta lectura, separación silábica y escritura en hilos distintos para
+    que la E/S de disco, el cálculo y la codificación de la salida se solapen.
+    
+    La etapa de separación puede usar varios hilos; solo aporta paralelismo real
+    en intérpretes free-threading (sin GIL). El archivo generado es idéntico al
+    de ProcesadorArchivos.procesar_archivo.
+    """
+    
+    def __init__(self, procesador=None, tamano_lote=1000, capacidad_cola=8, hilos_separacion=None):
+        """
+        Inicializa el pipeline.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que analiza y formatea cada palabra
+            tamano_lote (int): Palabras por lote entre etapas
+            capacidad_cola (int): Lotes máximos en cada cola
+            hilos_separacion (int): Hilos de la etapa de separación
+                                    (por defecto 1 con GIL, núcleos disponibles sin GIL)
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        self.tamano_lote = tamano_lote
+        self.capacidad_cola = capacidad_cola
+        if hilos_separacion is None:
+            hilos_separacion = 1 if Utilidades.gil_habilitado() else (os.cpu_count() or 1)
+        self.hilos_separacion = max(1, hilos_separacion)
+        
+        self.estadisticas = {}
+        self.tiempo_total = 0.0
+        self._cancelado = threading.Event()
+        self._errores = []
+    
+    def procesar_archivo(self, archivo_entrada, archivo_salida):
+        """
+        Procesa un archivo de palabras y genera la salida con separación silábica.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada
+            archivo_salida (str): Ruta del archivo de salida
+            
+        Returns:
+            int: Número de palabras procesadas (0 si hubo un error)
+        """
+        if not os.path.exists(archivo_entrada):
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        
+        self.estadisticas = {
+            nombre: EstadisticasEtapa(nombre) for nombre in ('lectura', 'separacion', 'escritura')
+        }
+        self._cancelado.clear()
+        self._errores = []
+        
+        cola_lotes = queue.Queue(self.capacidad_cola)
+        cola_resultados = queue.Queue(self.capacidad_cola)
+        vocabulario = {}
+        
+        hilos = [threading.Thread(target=self._etapa, name='lectura',
+                                  args=(self._leer, archivo_entrada, cola_lotes))]
+        for i in range(self.hilos_separacion):
+            hilos.append(threading.Thread(target=self._etapa, name=f'separacion-{i}',
+                                          args=(self._separar, cola_lotes, cola_resultados, vocabulario)))
+        hilos.append(threading.Thread(target=self._etapa, name='escritura',
+                                      args=(self._escribir, cola_resultados, archivo_salida)))
+        
+        inicio = time.perf_counter()
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        if self._errores:
+            print(f"Error en el pipeline de procesamiento: {self._errores[0]}")
+            return 0
+        
+        print(f"OK - Resultados guardados en '{archivo_salida}'")
+        return self.estadisticas['escritura'].elementos
+    
+    def _etapa(self, funcion, *args):
+        """Ejecuta una etapa y cancela el pipeline completo si falla"""
+        try:
+            funcion(*args)
+        except Exception as e:
+            self._errores.append(e)
+            self._cancelado.set()
+    
+    def _poner(self, cola, elemento):
+        """Encola un elemento esperando espacio, salvo que el pipeline se cancele"""
+        while not self._cancelado.is_set():
+            try:
+                cola.put(elemento, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _tomar(self, cola):
+        """
+        Toma el siguiente elemento de una cola.
+        
+        Returns:
+            tuple: (elemento, profundidad_cola); elemento es _FIN al cancelar
+        """
+        while not self._cancelado.is_set():
+            profundidad = cola.qsize()
+            try:
+                return cola.get(timeout=0.1), profundidad
+            except queue.Empty:
+                continue
+        return _FIN, 0
+    
+    def _leer(self, archivo_entrada, cola_lotes):
+        """Etapa de lectura: agrupa las palabras del archivo en lotes numerados"""
+        estadisticas = self.estadisticas['lectura']
+        indice = 0
+        lote = []
+        inicio = time.perf_counter()
+        
+        with abrir_texto(archivo_entrada, 'r') as f:
+            for linea in f:
+                palabra = linea.strip()
+                if not palabra:
+                    continue
+                lote.append(palabra)
+                if len(lote) >= self.tamano_lote:
+                    estadisticas.registrar(len(lote), time.perf_counter() - inicio)
+                    self._poner(cola_lotes, (indice, lote))
+                    indice += 1
+                    lote = []
+                    inicio = time.perf_counter()
+        
+        if lote:
+            estadisticas.registrar(len(lote), time.perf_counter() - inicio)
+            self._poner(cola_lotes, (indice, lote))
+        
+        for _ in range(self.hilos_separacion):
+            self._poner(cola_lotes, _FIN)
+    
+    def _separar(self, cola_lotes, cola_resultados, vocabulario):
+        """Etapa de separación: analiza cada lote con el procesador compartido"""
+        estadisticas = self.estadisticas['separacion']
+        while True:
+            elemento, profundidad = self._tomar(cola_lotes)
+            if elemento is _FIN:
+                break
+            
+            indice, lote = elemento
+            inicio = time.perf_counter()
+            resultados = self.procesador._procesar_palabras(lote, vocabulario)
+            estadisticas.registrar(len(lote), time.perf_counter() - inicio, profundidad)
+            self._poner(cola_resultados, (indice, resultados))
+        
+        self._poner(cola_resultados, _FIN)
+    
+    def _escribir(self, cola_resultados, archivo_salida):
+        """
+        Etapa de escritura: reordena los lotes y escribe la tabla directamente;
+        el análisis detallado se acumula en un temporal y se añade al final.
+        """
+        estadisticas = self.estadisticas['escritura']
+        procesador = self.procesador
+        pendientes = {}
+        siguiente = 0
+        numero = 0
+        activos = self.hilos_separacion
+        
+        directorio = os.path.dirname(os.path.abspath(archivo_salida))
+        with abrir_texto(archivo_salida, 'w') as f, \
+                tempfile.TemporaryFile('w+', encoding='utf-8', dir=directorio) as detalle:
+            procesador._escribir_encabezado(f)
+            
+            while activos:
+                elemento, profundidad = self._tomar(cola_resultados)
+                if self._cancelado.is_set():
+                    return
+                if elemento is _FIN:
+                    activos -= 1
+                    continue
+                
+                indice, resultados = elemento
+                pendientes[indice] = resultados
+                inicio = time.perf_counter()
+                escritas = 0
+                while siguiente in pendientes:
+                    for resultado in pendientes.pop(siguiente):
+                        numero += 1
+                        f.write(procesador._formatear_fila(resultado))
+                        detalle.write(procesador._formatear_detalle(numero, resultado))
+                        escritas += 1
+                    siguiente += 1
+                estadisticas.registrar(escritas, time.perf_counter() - inicio, profundidad)
+            
+            inicio = time.perf_counter()
+            procesador._escribir_inicio_detalle(f)
+            detalle.seek(0)
+            shutil.copyfileobj(detalle, f)
+            procesador._escribir_cierre(f)
+            estadisticas.tiempo_activo += time.perf_counter() - inicio
+    
+    def reporte(self):
+        """
+        Genera el resumen de rendimiento por etapa.
+        
+        Returns:
+            str: Texto con palabras/s de cada etapa y ocupación de colas
+        """
+        lineas = [
+            f"Pipeline: lote={self.tamano_lote}, cola={self.capacidad_cola}, "
+            f"hilos de separacion={self.hilos_separacion}, GIL={'si' if Utilidades.gil_habilitado() else 'no'}",
+            f"{'Etapa':<12} {'Palabras':>10} {'Lotes':>7} {'Activo (s)':>11} {'Palabras/s':>12} {'Cola prom.':>11} {'Cola max.':>10}",
+        ]
+        for estadisticas in self.estadisticas.values():
+            lineas.append(
+                f"{estadisticas.nombre:<12} {estadisticas.elementos:>10} {estadisticas.lotes:>7} "
+                f"{estadisticas.tiempo_activo:>11.3f} {estadisticas.rendimiento:>12.0f} "
+                f"{estadisticas.cola_promedio:>11.2f} {estadisticas.maximo_cola:>10}"
+            )
+        lineas.append(f"Tiempo total: {self.tiempo_total:.3f} s")
+        return "\n".join(lineas)
@@ -3,6 +3,8 @@ Módulo: Procesador de Archivos
 Descripción: Maneja la lectura y escritura de archivos de entrada y salida
 """
 
+from deduplicador_palabras import DeduplicadorPalabras
+from flujos_comprimidos import abrir_texto
 from separador_dfa import SeparadorDFA
 
 
@@ -20,6 +22,8 @@ class ProcesadorArchivos:
         """
         Procesa un archivo de palabras y genera la salida con separación silábica.
         
+        Los archivos .gz, .bz2, .xz y .zst se descomprimen y comprimen al vuelo.
+        
         Args:
             archivo_entrada (str): Ruta del archivo de entrada
             archivo_salida (str): Ruta del archivo de salida
@@ -52,7 +56,7 @@ class ProcesadorArchivos:
             list: Lista de palabras
         """
         try:
-            with open(archivo_entrada, 'r', encoding='utf-8') as f:
+            with abrir_texto(archivo_entrada, 'r') as f:
                 palabras = [linea.strip() for linea in f if linea.strip()]
             return palabras
         except FileNotFoundError:
@@ -62,47 +66,124 @@ class ProcesadorArchivos:
             print(f"Error al leer el archivo: {e}")
             return []
     
-    def _procesar_palabras(self, palabras):
+    def _iterar_palabras(self, archivo_entrada):
+        """
+        Recorre las palabras del archivo de entrada sin cargarlo completo en memoria.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo
+            
+        Yields:
+            str: Cada palabra (línea no vacía) del archivo
+        """
+        with abrir_texto(archivo_entrada, 'r') as f:
+            for linea in f:
+                palabra = linea.strip()
+                if palabra:
+                    yield palabra
+    
+    def _procesar_palabras(self, palabras, vocabulario=None):
         """
         Procesa una lista de palabras con análisis completo.
         
+        Cada palabra distinta (según su forma normalizada) se separa una sola vez;
+        las repeticiones reutilizan el resultado y se expanden en el orden de entrada.
+        
         Args:
             palabras (list): Lista de palabras a procesar
-            
+            vocabulario (dict): Resultados ya calculados por palabra normalizada,
+                                compartidos entre llamadas (opcional)
+                                
         Returns:
             list: Lista de diccionarios con resultados (incluye análisis regex)
         """
+        if vocabulario is None:
+            vocabulario = {}
         resultados = []
         for palabra in palabras:
-            separacion, reglas, analisis = self.separador.separar_silabas(palabra)
-            
-            # Determinar tipo de fenómeno: DIPTONGO, DIGRAFO, HIATO
-            digrafos = analisis.get('digrafos', [])
-            diptongos = analisis.get('diptongos', [])
-            hiatos = analisis.get('hiatos', [])
-            
-            # Prioridad: DIGRAFO > DIPTONGO > HIATO
-            if digrafos:
-                tipo_fenomeno = 'DIGRAFO'
-            elif diptongos:
-                tipo_fenomeno = 'DIPTONGO'
-            elif hiatos:
-                tipo_fenomeno = 'HIATO'
+            clave = self.separador.normalizar(palabra)
+            base = vocabulario.get(clave)
+            if base is None:
+                base = self._analizar_palabra(palabra)
+                vocabulario[clave] = base
+                resultados.append(base)
             else:
-                tipo_fenomeno = '---'
-            
-            resultados.append({
-                'original': palabra,
-                'separacion': separacion,
-                'reglas': ', '.join(reglas),
-                'estructura': analisis.get('estructura', ''),
-                'tipo_fenomeno': tipo_fenomeno,
-                'digrafos': digrafos,
-                'diptongos': diptongos,
-                'hiatos': hiatos
-            })
+                resultados.append(dict(base, original=palabra))
         return resultados
     
+    def _analizar_palabra(self, palabra):
+        """
+        Separa una palabra y clasifica el fenómeno silábico dominante.
+        
+        Args:
+            palabra (str): Palabra a analizar
+            
+        Returns:
+            dict: Resultado con separación, reglas, estructura y patrones
+        """
+        separacion, reglas, analisis = self.separador.separar_silabas(palabra)
+        
+        # Determinar tipo de fenómeno: DIPTONGO, DIGRAFO, HIATO
+        digrafos = analisis.get('digrafos', [])
+        diptongos = analisis.get('diptongos', [])
+        hiatos = analisis.get('hiatos', [])
+        
+        # Prioridad: DIGRAFO > DIPTONGO > HIATO
+        if digrafos:
+            tipo_fenomeno = 'DIGRAFO'
+        elif diptongos:
+            tipo_fenomeno = 'DIPTONGO'
+        elif hiatos:
+            tipo_fenomeno = 'HIATO'
+        else:
+            tipo_fenomeno = '---'
+        
+        return {
+            'original': palabra,
+            'separacion': separacion,
+            'reglas': ', '.join(reglas),
+            'estructura': analisis.get('estructura', ''),
+            'tipo_fenomeno': tipo_fenomeno,
+            'digrafos': digrafos,
+            'diptongos': diptongos,
+            'hiatos': hiatos
+        }
+    
+    def procesar_frecuencias(self, archivo_entrada, archivo_salida, limite_memoria=200000):
+        """
+        Genera un resumen ponderado por frecuencia: cada palabra distinta se
+        separa una vez y se reporta junto con su número de apariciones.
+        
+        El conteo usa ordenamiento externo, por lo que la memoria depende del
+        tamaño del vocabulario y no del número de palabras de la entrada.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada
+            archivo_salida (str): Ruta del archivo de salida
+            limite_memoria (int): Palabras distintas en memoria antes de volcar a disco
+            
+        Returns:
+            list: Resultados con la clave adicional 'frecuencia', de mayor a menor
+        """
+        deduplicador = DeduplicadorPalabras(self.separador.normalizar, limite_memoria)
+        try:
+            conteo = deduplicador.contar(self._iterar_palabras(archivo_entrada))
+            resumen = []
+            for palabra, frecuencia in conteo:
+                resultado = self._analizar_palabra(palabra)
+                resultado['frecuencia'] = frecuencia
+                resumen.append(resultado)
+        except FileNotFoundError:
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return []
+        except Exception as e:
+            print(f"Error al leer el archivo: {e}")
+            return []
+        
+        resumen.sort(key=lambda r: (-r['frecuencia'], r['original']))
+        self._generar_resumen_frecuencias(archivo_salida, resumen, deduplicador.total_palabras)
+        return resumen
+    
     def _generar_archivo_salida(self, archivo_salida, resultados):
         """
         Genera el archivo de salida con los resultados y análisis completo.
@@ -112,54 +193,125 @@ class ProcesadorArchivos:
             resultados (list): Lista de resultados a guardar
         """
         try:
-            with open(archivo_salida, 'w', encoding='utf-8') as f:
-                f.write("=" * 130 + "\n")
-                f.write("SEPARACION SILABICA - AUTOMATA FINITO DETERMINISTA CON EXPRESIONES REGULARES\n")
-                f.write("Universidad Politecnica de Chiapas - Lenguajes y Automatas\n")
-                f.write("=" * 130 + "\n\n")
-                
-                # Encabezados principales
-                f.write(f"{'Palabra Original':<15} {'Separacion':<20} {'Tipo':<15} {'Estructura':<20} {'Digrafos/Diptongos':<20}\n")
-                f.write("-" * 130 + "\n")
+            with abrir_texto(archivo_salida, 'w') as f:
+                self._escribir_encabezado(f)
                 
                 # Resultados
                 for resultado in resultados:
-                    digrafos_str = ', '.join([d[1] for d in resultado['digrafos']]) if resultado['digrafos'] else ''
-                    diptongos_str = ', '.join([d[1] for d in resultado['diptongos']]) if resultado['diptongos'] else ''
-                    hiatos_str = ', '.join([d[1] for d in resultado['hiatos']]) if resultado['hiatos'] else ''
-                    
-                    # Combinar digrafos, diptongos e hiatos en una sola columna
-                    patrones = digrafos_str if digrafos_str else (diptongos_str if diptongos_str else hiatos_str)
-                    patrones = patrones if patrones else "---"
-                    
-                    f.write(f"{resultado['original']:<15} {resultado['separacion']:<20} {resultado['tipo_fenomeno']:<15} {resultado['estructura']:<20} {patrones:<20}\n")
+                    f.write(self._formatear_fila(resultado))
                 
                 # Seccion de analisis detallado
-                f.write("\n" + "=" * 130 + "\n")
-                f.write("ANALISIS DETALLADO CON EXPRESIONES REGULARES\n")
-                f.write("=" * 130 + "\n\n")
+                self._escribir_inicio_detalle(f)
                 
                 for i, resultado in enumerate(resultados, 1):
-                    f.write(f"[{i}] {resultado['original']}\n")
-                    f.write(f"    Separacion: {resultado['separacion']}\n")
-                    f.write(f"    Estructura V/C: {resultado['estructura']}\n")
-                    f.write(f"    Tipo: {resultado['tipo_fenomeno']}\n")
-                    f.write(f"    Reglas: {resultado['reglas']}\n")
-                    
-                    if resultado['digrafos']:
-                        f.write(f"    Digrafos: {[d[1] for d in resultado['digrafos']]}\n")
-                    if resultado['diptongos']:
-                        f.write(f"    Diptongos: {[d[1] for d in resultado['diptongos']]}\n")
-                    if resultado['hiatos']:
-                        f.write(f"    Hiatos: {[d[1] for d in resultado['hiatos']]}\n")
-                    f.write("\n")
+                    f.write(self._formatear_detalle(i, resultado))
                 
-                f.write("=" * 130 + "\n")
+                self._escribir_cierre(f)
             
             print(f"OK - Resultados guardados en '{archivo_salida}'")
         except Exception as e:
             print(f"Error al generar el archivo de salida: {e}")
     
+    def _escribir_encabezado(self, f):
+        """Escribe el título y los encabezados de la tabla de resultados"""
+        f.write("=" * 130 + "\n")
+        f.write("SEPARACION SILABICA - AUTOMATA FINITO DETERMINISTA CON EXPRESIONES REGULARES\n")
+        f.write("Universidad Politecnica de Chiapas - Lenguajes y Automatas\n")
+        f.write("=" * 130 + "\n\n")
+        
+        # Encabezados principales
+        f.write(f"{'Palabra Original':<15} {'Separacion':<20} {'Tipo':<15} {'Estructura':<20} {'Digrafos/Diptongos':<20}\n")
+        f.write("-" * 130 + "\n")
+    
+    def _formatear_fila(self, resultado):
+        """
+        Formatea la fila de la tabla de resultados para una palabra.
+        
+        Args:
+            resultado (dict): Resultado de una palabra
+            
+        Returns:
+            str: Línea de la tabla (con salto de línea)
+        """
+        digrafos_str = ', '.join([d[1] for d in resultado['digrafos']]) if resultado['digrafos'] else ''
+        diptongos_str = ', '.join([d[1] for d in resultado['diptongos']]) if resultado['diptongos'] else ''
+        hiatos_str = ', '.join([d[1] for d in resultado['hiatos']]) if resultado['hiatos'] else ''
+        
+        # Combinar digrafos, diptongos e hiatos en una sola columna
+        patrones = digrafos_str if digrafos_str else (diptongos_str if diptongos_str else hiatos_str)
+        patrones = patrones if patrones else "---"
+        
+        return f"{resultado['original']:<15} {resultado['separacion']:<20} {resultado['tipo_fenomeno']:<15} {resultado['estructura']:<20} {patrones:<20}\n"
+    
+    def _escribir_inicio_detalle(self, f):
+        """Escribe el título de la sección de análisis detallado"""
+        f.write("\n" + "=" * 130 + "\n")
+        f.write("ANALISIS DETALLADO CON EXPRESIONES REGULARES\n")
+        f.write("=" * 130 + "\n\n")
+    
+    def _formatear_detalle(self, numero, resultado):
+        """
+        Formatea la entrada del análisis detallado para una palabra.
+        
+        Args:
+            numero (int): Número de la palabra en la salida (desde 1)
+            resultado (dict): Resultado de una palabra
+            
+        Returns:
+            str: Bloque de líneas del análisis detallado
+        """
+        lineas = [
+            f"[{numero}] {resultado['original']}\n",
+            f"    Separacion: {resultado['separacion']}\n",
+            f"    Estructura V/C: {resultado['estructura']}\n",
+            f"    Tipo: {resultado['tipo_fenomeno']}\n",
+            f"    Reglas: {resultado['reglas']}\n",
+        ]
+        
+        if resultado['digrafos']:
+            lineas.append(f"    Digrafos: {[d[1] for d in resultado['digrafos']]}\n")
+        if resultado['diptongos']:
+            lineas.append(f"    Diptongos: {[d[1] for d in resultado['diptongos']]}\n")
+        if resultado['hiatos']:
+            lineas.append(f"    Hiatos: {[d[1] for d in resultado['hiatos']]}\n")
+        lineas.append("\n")
+        return ''.join(lineas)
+    
+    def _escribir_cierre(self, f):
+        """Escribe la línea final del archivo de salida"""
+        f.write("=" * 130 + "\n")
+    
+    def _generar_resumen_frecuencias(self, archivo_salida, resumen, total_palabras):
+        """
+        Genera el archivo de salida con el resumen ponderado por frecuencia.
+        
+        Args:
+            archivo_salida (str): Ruta del archivo de salida
+            resumen (list): Resultados con frecuencia, ordenados
+            total_palabras (int): Número total de palabras leídas
+        """
+        try:
+            with abrir_texto(archivo_salida, 'w') as f:
+                f.write("=" * 130 + "\n")
+                f.write("SEPARACION SILABICA - RESUMEN POR FRECUENCIA\n")
+                f.write("Universidad Politecnica de Chiapas - Lenguajes y Automatas\n")
+                f.write("=" * 130 + "\n\n")
+                f.write(f"Palabras leidas: {total_palabras}\n")
+                f.write(f"Palabras distintas: {len(resumen)}\n\n")
+                
+                f.write(f"{'Palabra':<20} {'Separacion':<25} {'Frecuencia':>10} {'%':>8}  {'Tipo':<15} {'Estructura':<20}\n")
+                f.write("-" * 130 + "\n")
+                
+                for resultado in resumen:
+                    porcentaje = 100.0 * resultado['frecuencia'] / total_palabras if total_palabras else 0.0
+                    f.write(f"{resultado['original']:<20} {resultado['separacion']:<25} {resultado['frecuencia']:>10} {porcentaje:>7.3f}%  {resultado['tipo_fenomeno']:<15} {resultado['estructura']:<20}\n")
+                
+                f.write("=" * 130 + "\n")
+            
+            print(f"OK - Resumen de frecuencias guardado en '{archivo_salida}'")
+        except Exception as e:
+            print(f"Error al generar el archivo de salida: {e}")
+    
     def mostrar_resultados_consola(self, resultados):
         """
         Muestra los resultados en la consola con información extendida.
@@ -0,0 +1,257 @@
+"""
+Módulo: Procesamiento Incremental
+Descripción: Reprocesa solo las partes de la entrada que cambiaron desde la última
+             ejecución, dividiéndola en fragmentos definidos por su contenido
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import zlib
+
+from flujos_comprimidos import abrir_binario, abrir_texto
+from procesador_archivos import ProcesadorArchivos
+
+
+class ProcesadorIncremental:
+    """
+    Divide la entrada en fragmentos de líneas cuyos límites dependen solo del
+    contenido (una línea cierra fragmento cuando su CRC32 cumple una máscara),
+    de modo que una edición pequeña solo altera los fragmentos que la contienen.
+    
+    En <salida>.incremental/ se guarda, por fragmento, su parte de la tabla y
+    del análisis detallado, junto con un manifiesto de hashes. En la siguiente
+    ejecución solo se separan los fragmentos nuevos o modificados y la salida se
+    arma copiando los demás; si un fragmento cambia de posición en la numeración
+    del análisis detallado, solo se renumeran sus encabezados.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, procesador=None, lineas_promedio=1024, lineas_minimas=64, lineas_maximas=8192):
+        """
+        Inicializa el procesador incremental.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que analiza y formatea cada palabra
+            lineas_promedio (int): Tamaño medio de fragmento en líneas (potencia de 2)
+            lineas_minimas (int): Líneas mínimas por fragmento
+            lineas_maximas (int): Líneas máximas por fragmento
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        self.mascara = lineas_promedio - 1
+        self.lineas_minimas = lineas_minimas
+        self.lineas_maximas = lineas_maximas
+        
+        self.fragmentos = 0
+        self.reutilizados = 0
+        self.palabras = 0
+        self.palabras_recalculadas = 0
+        self.tiempo_total = 0.0
+    
+    def procesar_archivo(self, archivo_entrada, archivo_salida):
+        """
+        Procesa un archivo reutilizando los fragmentos de la ejecución anterior.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada
+            archivo_salida (str): Ruta del archivo de salida
+            
+        Returns:
+            int: Número de palabras en la salida (0 si hubo un error)
+        """
+        if not os.path.exists(archivo_entrada):
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        
+        directorio = archivo_salida + '.incremental'
+        inicio = time.perf_counter()
+        try:
+            os.makedirs(directorio, exist_ok=True)
+            anterior = self._cargar_manifiesto(directorio)
+            manifiesto = self._procesar_fragmentos(archivo_entrada, directorio, anterior)
+            self._ensamblar_salida(archivo_salida, directorio, manifiesto)
+            self._guardar_manifiesto(directorio, manifiesto)
+            self._limpiar(directorio, manifiesto)
+        except Exception as e:
+            print(f"Error durante el procesamiento incremental: {e}")
+            return 0
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        print(f"OK - Resultados guardados en '{archivo_salida}'")
+        return self.palabras
+    
+    def _fragmentar(self, archivo_entrada):
+        """
+        Recorre la entrada y produce sus fragmentos definidos por contenido.
+        
+        Yields:
+            list: Líneas (bytes) de cada fragmento
+        """
+        fragmento = []
+        with abrir_binario(archivo_entrada) as f:
+            for linea in f:
+                fragmento.append(linea)
+                if len(fragmento) < self.lineas_minimas:
+                    continue
+                if (zlib.crc32(linea) & self.mascara) == 0 or len(fragmento) >= self.lineas_maximas:
+                    yield fragmento
+                    fragmento = []
+        if fragmento:
+            yield fragmento
+    
+    def _procesar_fragmentos(self, archivo_entrada, directorio, anterior):
+        """
+        Separa los fragmentos que no existen en la ejecución anterior.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada
+            directorio (str): Directorio de fragmentos
+            anterior (dict): Fragmentos conocidos por hash
+            
+        Returns:
+            list: Manifiesto nuevo (hash, palabras y numeración base de cada fragmento)
+        """
+        manifiesto = []
+        vocabulario = {}
+        base = 0
+        self.fragmentos = self.reutilizados = 0
+        self.palabras = self.palabras_recalculadas = 0
+        
+        for lineas in self._fragmentar(archivo_entrada):
+            huella = hashlib.blake2b(b''.join(lineas), digest_size=16).hexdigest()
+            conocido = anterior.get(huella)
+            if conocido is not None and self._existe_fragmento(directorio, huella):
+                palabras = conocido['palabras']
+                base_guardada = conocido['base']
+                self.reutilizados += 1
+            else:
+                palabras = self._separar_fragmento(lineas, directorio, huella, base, vocabulario)
+                base_guardada = base
+                self.palabras_recalculadas += palabras
+            
+            manifiesto.append({'hash': huella, 'palabras': palabras, 'base': base_guardada})
+            anterior[huella] = manifiesto[-1]
+            base += palabras
+            self.fragmentos += 1
+        
+        self.palabras = base
+        return manifiesto
+    
+    def _separar_fragmento(self, lineas, directorio, huella, base, vocabulario):
+        """
+        Separa las palabras de un fragmento y guarda su tabla y su detalle.
+        
+        Returns:
+            int: Número de palabras del fragmento
+        """
+        procesador = self.procesador
+        palabras = [palabra for palabra in (linea.decode('utf-8').strip() for linea in lineas) if palabra]
+        resultados = procesador._procesar_palabras(palabras, vocabulario)
+        
+        ruta = os.path.join(directorio, huella)
+        with open(ruta + '.tabla.tmp', 'w', encoding='utf-8') as tabla, \
+                open(ruta + '.detalle.tmp', 'w', encoding='utf-8') as detalle:
+            for numero, resultado in enumerate(resultados, base + 1):
+                tabla.write(procesador._formatear_fila(resultado))
+                detalle.write(procesador._formatear_detalle(numero, resultado))
+        os.replace(ruta + '.tabla.tmp', ruta + '.tabla')
+        os.replace(ruta + '.detalle.tmp', ruta + '.detalle')
+        return len(resultados)
+    
+    def _ensamblar_salida(self, archivo_salida, directorio, manifiesto):
+        """Arma el archivo de salida concatenando los fragmentos en orden"""
+        procesador = self.procesador
+        carpeta, nombre = os.path.split(archivo_salida)
+        temporal = os.path.join(carpeta, '.tmp-' + nombre)
+        
+        with abrir_texto(temporal, 'w') as f:
+            procesador._escribir_encabezado(f)
+            for fragmento in manifiesto:
+                with open(os.path.join(directorio, fragmento['hash'] + '.tabla'),
+                          'r', encoding='utf-8', newline='') as tabla:
+                    shutil.copyfileobj(tabla, f)
+            
+            procesador._escribir_inicio_detalle(f)
+            base = 0
+            for fragmento in manifiesto:
+                ruta = os.path.join(directorio, fragmento['hash'] + '.detalle')
+                with open(ruta, 'r', encoding='utf-8', newline='') as detalle:
+                    if fragmento['base'] == base:
+                        shutil.copyfileobj(detalle, f)
+                    else:
+                        self._copiar_renumerado(detalle, f, base + 1)
+                base += fragmento['palabras']
+            procesador._escribir_cierre(f)
+        
+        os.replace(temporal, archivo_salida)
+    
+    @staticmethod
+    def _copiar_renumerado(origen, destino, primero):
+        """
+        Copia un detalle reemplazando la numeración '[n]' de sus palabras, que es
+        consecutiva dentro del fragmento, por la que empieza en 'primero'.
+        
+        Solo los encabezados de palabra empiezan por '[' al inicio de línea; el
+        resto de líneas del análisis detallado están sangradas o vacías.
+        """
+        texto = origen.read()
+        if not texto:
+            return
+        entradas = texto[1:].split('\n[')
+        destino.write('[' + '\n['.join([
+            f"{numero}{entrada[entrada.index(']'):]}"
+            for numero, entrada in enumerate(entradas, primero)
+        ]))
+    
+    @staticmethod
+    def _existe_fragmento(directorio, huella):
+        """Comprueba que los archivos de un fragmento sigan en disco"""
+        ruta = os.path.join(directorio, huella)
+        return os.path.exists(ruta + '.tabla') and os.path.exists(ruta + '.detalle')
+    
+    def _cargar_manifiesto(self, directorio):
+        """
+        Lee el manifiesto de la ejecución anterior.
+        
+        Returns:
+            dict: Fragmentos por hash (vacío si no hay manifiesto válido)
+        """
+        try:
+            with open(os.path.join(directorio, 'manifiesto.json'), 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if datos.get('version') != self.VERSION:
+            return {}
+        return {fragmento['hash']: fragmento for fragmento in datos['fragmentos']}
+    
+    def _guardar_manifiesto(self, directorio, manifiesto):
+        """Escribe el manifiesto de forma atómica"""
+        ruta = os.path.join(directorio, 'manifiesto.json')
+        with open(ruta + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'fragmentos': manifiesto}, f)
+        os.replace(ruta + '.tmp', ruta)
+    
+    @staticmethod
+    def _limpiar(directorio, manifiesto):
+        """Elimina los fragmentos que ya no forman parte de la entrada"""
+        vigentes = {fragmento['hash'] for fragmento in manifiesto}
+        for nombre in os.listdir(directorio):
+            huella, _, extension = nombre.partition('.')
+            if extension in ('tabla', 'detalle') and huella not in vigentes:
+                os.remove(os.path.join(directorio, nombre))
+    
+    def reporte(self):
+        """
+        Resume cuánto trabajo se reutilizó.
+        
+        Returns:
+            str: Fragmentos reutilizados y palabras recalculadas
+        """
+        porcentaje = 100.0 * self.palabras_recalculadas / self.palabras if self.palabras else 0.0
+        return (f"Fragmentos: {self.fragmentos} ({self.reutilizados} reutilizados) - "
+                f"Palabras recalculadas: {self.palabras_recalculadas} de {self.palabras} "
+                f"({porcentaje:.2f}%) - Tiempo: {self.tiempo_total:.3f} s")
@@ -0,0 +1,335 @@
+"""
+Módulo: Procesamiento Reanudable
+Descripción: Procesa archivos grandes guardando puntos de control periódicos para
+             poder reanudar un trabajo interrumpido sin empezar de nuevo
+"""
+
+import io
+import itertools
+import json
+import os
+import pickle
+import shutil
+import time
+
+from flujos_comprimidos import abrir_binario, detectar_formato
+from procesador_archivos import ProcesadorArchivos
+
+
+class ProcesadorReanudable:
+    """
+    Procesa un archivo por lotes escribiendo la salida de forma incremental.
+    
+    Junto al archivo de salida se mantienen:
+    - <salida>.detalle.parcial: análisis detallado pendiente de añadir al final
+    - <salida>.cache: resultados ya calculados por palabra (registros pickle añadidos)
+    - <salida>.checkpoint: último punto de control consistente (JSON)
+    
+    Un punto de control se escribe tras sincronizar (fsync) los tres archivos
+    anteriores y se publica con os.replace, por lo que siempre describe un
+    prefijo completo de la salida. Al reanudar se truncan los datos posteriores
+    al punto de control y se continúa desde su desplazamiento en la entrada;
+    el resultado final es idéntico byte a byte al de una ejecución sin cortes.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, procesador=None, tamano_lote=1000, intervalo=10.0, sobrecarga_maxima=0.02):
+        """
+        Inicializa el procesador reanudable.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que analiza y formatea cada palabra
+            tamano_lote (int): Palabras por lote
+            intervalo (float): Segundos mínimos entre puntos de control
+            sobrecarga_maxima (float): Fracción del tiempo que se admite dedicar a los
+                                       puntos de control; si se supera, el intervalo se duplica
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.sobrecarga_maxima = sobrecarga_maxima
+        
+        self.palabras = 0
+        self.puntos_control = 0
+        self.tiempo_puntos_control = 0.0
+        self.tiempo_total = 0.0
+    
+    @staticmethod
+    def rutas_auxiliares(archivo_salida):
+        """
+        Obtiene las rutas de los archivos auxiliares de un trabajo.
+        
+        Args:
+            archivo_salida (str): Ruta del archivo de salida
+            
+        Returns:
+            dict: Rutas de 'detalle', 'cache' y 'checkpoint'
+        """
+        return {
+            'detalle': archivo_salida + '.detalle.parcial',
+            'cache': archivo_salida + '.cache',
+            'checkpoint': archivo_salida + '.checkpoint',
+        }
+    
+    def procesar_archivo(self, archivo_entrada, archivo_salida, reanudar=False):
+        """
+        Procesa un archivo con puntos de control periódicos.
+        
+        Args:
+            archivo_entrada (str): Ruta del archivo de entrada (puede estar comprimido)
+            archivo_salida (str): Ruta del archivo de salida (texto sin comprimir)
+            reanudar (bool): Continuar desde el último punto de control si existe
+            
+        Returns:
+            int: Número total de palabras en la salida (0 si hubo un error)
+        """
+        if detectar_formato(archivo_salida, 'w') is not None:
+            print("Error: los puntos de control requieren un archivo de salida sin comprimir")
+            return 0
+        if not os.path.exists(archivo_entrada):
+            print(f"Error: No se encontró el archivo '{archivo_entrada}'")
+            return 0
+        
+        rutas = self.rutas_auxiliares(archivo_salida)
+        estado = self._cargar_checkpoint(rutas, archivo_entrada, archivo_salida) if reanudar else None
+        if reanudar and estado is None:
+            print("No hay un punto de control válido: se procesa desde el inicio")
+        if estado is None:
+            # Un trabajo nuevo no debe poder reanudarse desde el estado de otro anterior
+            for ruta in rutas.values():
+                if os.path.exists(ruta):
+                    os.remove(ruta)
+        
+        self.puntos_control = 0
+        self.tiempo_puntos_control = 0.0
+        inicio = time.perf_counter()
+        try:
+            self._ejecutar(archivo_entrada, archivo_salida, rutas, estado)
+        except Exception as e:
+            print(f"Error durante el procesamiento: {e}")
+            return 0
+        self.tiempo_total = time.perf_counter() - inicio
+        
+        print(f"OK - Resultados guardados en '{archivo_salida}'")
+        return self.palabras
+    
+    def _ejecutar(self, archivo_entrada, archivo_salida, rutas, estado):
+        """Procesa la entrada por lotes desde el estado indicado (o desde cero)"""
+        procesador = self.procesador
+        
+        if estado is None:
+            estado = {
+                'desplazamiento_entrada': 0,
+                'desplazamiento_salida': 0,
+                'desplazamiento_detalle': 0,
+                'desplazamiento_cache': 0,
+                'palabras': 0,
+            }
+            modo = 'w+b'
+        else:
+            modo = 'r+b'
+        
+        with open(archivo_salida, modo) as salida, \
+                open(rutas['detalle'], modo) as detalle, \
+                open(rutas['cache'], modo) as cache, \
+                abrir_binario(archivo_entrada) as entrada:
+            
+            # Descartar lo escrito después del punto de control
+            for archivo, clave in ((salida, 'desplazamiento_salida'),
+                                   (detalle, 'desplazamiento_detalle'),
+                                   (cache, 'desplazamiento_cache')):
+                archivo.truncate(estado[clave])
+                archivo.seek(estado[clave])
+            
+            vocabulario = self._cargar_cache(cache, estado['desplazamiento_cache'])
+            guardadas = len(vocabulario)
+            self._avanzar_entrada(entrada, estado['desplazamiento_entrada'])
+            
+            if estado['desplazamiento_salida'] == 0:
+                salida.write(self._texto(procesador._escribir_encabezado))
+            
+            desplazamiento = estado['desplazamiento_entrada']
+            numero = estado['palabras']
+            ultimo_punto = time.perf_counter()
+            inicio_trabajo = ultimo_punto
+            
+            while True:
+                lote, desplazamiento = self._leer_lote(entrada, desplazamiento)
+                if not lote:
+                    break
+                
+                filas = []
+                bloques_detalle = []
+                for resultado in procesador._procesar_palabras(lote, vocabulario):
+                    numero += 1
+                    filas.append(procesador._formatear_fila(resultado))
+                    bloques_detalle.append(procesador._formatear_detalle(numero, resultado))
+                salida.write(''.join(filas).encode('utf-8'))
+                detalle.write(''.join(bloques_detalle).encode('utf-8'))
+                
+                if time.perf_counter() - ultimo_punto >= self.intervalo:
+                    guardadas = self._guardar_checkpoint(
+                        rutas, archivo_entrada, salida, detalle, cache,
+                        vocabulario, guardadas, desplazamiento, numero
+                    )
+                    ultimo_punto = time.perf_counter()
+                    self._ajustar_intervalo(ultimo_punto - inicio_trabajo)
+            
+            # Añadir la sección de análisis detallado y cerrar el archivo
+            salida.write(self._texto(procesador._escribir_inicio_detalle))
+            detalle.flush()
+            detalle.seek(0)
+            shutil.copyfileobj(detalle, salida)
+            salida.write(self._texto(procesador._escribir_cierre))
+            salida.flush()
+            os.fsync(salida.fileno())
+        
+        self.palabras = numero
+        for ruta in rutas.values():
+            if os.path.exists(ruta):
+                os.remove(ruta)
+    
+    def _leer_lote(self, entrada, desplazamiento):
+        """
+        Lee hasta tamano_lote palabras completas de la entrada binaria.
+        
+        Returns:
+            tuple: (palabras, desplazamiento_tras_el_lote)
+        """
+        palabras = []
+        while len(palabras) < self.tamano_lote:
+            linea = entrada.readline()
+            if not linea:
+                break
+            desplazamiento += len(linea)
+            palabra = linea.decode('utf-8').strip()
+            if palabra:
+                palabras.append(palabra)
+        return palabras, desplazamiento
+    
+    @staticmethod
+    def _avanzar_entrada(entrada, desplazamiento):
+        """Sitúa la entrada en el desplazamiento indicado (leyendo si no admite seek)"""
+        if entrada.seekable():
+            entrada.seek(desplazamiento)
+            return
+        restante = desplazamiento
+        while restante:
+            leido = len(entrada.read(min(restante, 1 << 20)))
+            if not leido:
+                raise ValueError("La entrada es más corta que el punto de control")
+            restante -= leido
+    
+    @staticmethod
+    def _texto(escribir):
+        """Ejecuta una función de escritura de ProcesadorArchivos y devuelve sus bytes"""
+        buffer = io.StringIO()
+        escribir(buffer)
+        return buffer.getvalue().encode('utf-8')
+    
+    @staticmethod
+    def _cargar_cache(cache, limite):
+        """
+        Reconstruye el vocabulario desde los registros pickle de la caché.
+        
+        Args:
+            cache (file): Archivo de caché abierto en binario
+            limite (int): Bytes válidos según el punto de control
+            
+        Returns:
+            dict: Resultados por palabra normalizada
+        """
+        vocabulario = {}
+        cache.seek(0)
+        while cache.tell() < limite:
+            vocabulario.update(pickle.load(cache))
+        cache.seek(limite)
+        return vocabulario
+    
+    def _guardar_checkpoint(self, rutas, archivo_entrada, salida, detalle, cache,
+                            vocabulario, guardadas, desplazamiento, numero):
+        """
+        Sincroniza las salidas, añade a la caché los resultados nuevos y publica
+        atómicamente el punto de control.
+        
+        Returns:
+            int: Número de entradas del vocabulario ya guardadas en la caché
+        """
+        inicio = time.perf_counter()
+        
+        if len(vocabulario) > guardadas:
+            nuevas = dict(itertools.islice(vocabulario.items(), guardadas, None))
+            pickle.dump(nuevas, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        for archivo in (salida, detalle, cache):
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        
+        datos_entrada = os.stat(archivo_entrada)
+        estado = {
+            'version': self.VERSION,
+            'entrada': os.path.abspath(archivo_entrada),
+            'tamano_entrada': datos_entrada.st_size,
+            'mtime_entrada': datos_entrada.st_mtime_ns,
+            'desplazamiento_entrada': desplazamiento,
+            'desplazamiento_salida': salida.tell(),
+            'desplazamiento_detalle': detalle.tell(),
+            'desplazamiento_cache': cache.tell(),
+            'palabras': numero,
+        }
+        temporal = rutas['checkpoint'] + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(estado, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, rutas['checkpoint'])
+        
+        self.puntos_control += 1
+        self.tiempo_puntos_control += time.perf_counter() - inicio
+        return len(vocabulario)
+    
+    def _ajustar_intervalo(self, transcurrido):
+        """Duplica el intervalo si los puntos de control superan la sobrecarga admitida"""
+        if transcurrido and self.tiempo_puntos_control / transcurrido > self.sobrecarga_maxima:
+            self.intervalo *= 2
+    
+    def _cargar_checkpoint(self, rutas, archivo_entrada, archivo_salida):
+        """
+        Lee y valida el último punto de control: debe corresponder a la misma
+        entrada sin modificar (tamaño y fecha) y sus desplazamientos no pueden
+        superar el tamaño actual de la salida, el detalle y la caché.
+        
+        Returns:
+            dict: Estado guardado o None si no existe o no corresponde a la entrada
+        """
+        try:
+            with open(rutas['checkpoint'], 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        datos_entrada = os.stat(archivo_entrada)
+        if (estado.get('version') != self.VERSION
+                or estado.get('entrada') != os.path.abspath(archivo_entrada)
+                or estado.get('tamano_entrada') != datos_entrada.st_size
+                or estado.get('mtime_entrada') != datos_entrada.st_mtime_ns):
+            return None
+        
+        for ruta, clave in ((archivo_salida, 'desplazamiento_salida'),
+                            (rutas['detalle'], 'desplazamiento_detalle'),
+                            (rutas['cache'], 'desplazamiento_cache')):
+            if not os.path.exists(ruta) or estado.get(clave, -1) > os.path.getsize(ruta):
+                return None
+        return estado
+    
+    def reporte(self):
+        """
+        Resume el costo de los puntos de control.
+        
+        Returns:
+            str: Palabras, puntos de control y porcentaje de sobrecarga
+        """
+        sobrecarga = 100.0 * self.tiempo_puntos_control / self.tiempo_total if self.tiempo_total else 0.0
+        return (f"Palabras: {self.palabras} - Puntos de control: {self.puntos_control} "
+                f"({self.tiempo_puntos_control:.3f} s, {sobrecarga:.2f}% del tiempo total "
+                f"de {self.tiempo_total:.3f} s)")
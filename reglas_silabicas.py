@@ -5,50 +5,115 @@ Descripción: Define las reglas y clasificaciones para la separación silábica
 """
 
 import re
+import unicodedata
+
+
+def _construir_tabla_normalizacion():
+    """
+    Construye la tabla de str.translate que pasa a minúsculas los alfabetos
+    latino, griego y cirílico y lleva las variantes de vocales a su forma
+    canónica en español (ü y ñ se conservan).
+    
+    Returns:
+        dict: Tabla para str.translate
+    """
+    canonicas = {
+        'à': 'á', 'è': 'é', 'ì': 'í', 'ò': 'ó', 'ù': 'ú',
+        'â': 'a', 'ê': 'e', 'î': 'i', 'ô': 'o', 'û': 'u',
+        'ä': 'a', 'ë': 'e', 'ï': 'i', 'ö': 'o',
+    }
+    tabla = {}
+    for codigo in range(0x0530):
+        char = chr(codigo)
+        destino = char.lower()
+        destino = canonicas.get(destino, destino)
+        if destino != char:
+            tabla[codigo] = destino
+    
+    # Guion blando y caracteres de ancho cero que aparecen en textos copiados
+    for invisible in '\u00ad\u200b\u200c\u200d\ufeff':
+        tabla[ord(invisible)] = None
+    return tabla
 
 
 class ReglasSilabicas:
     """
     Contiene todas las reglas y definiciones para la clasificación de caracteres
     y la separación silábica en español.
+    
+    Las tablas son atributos de clase inmutables (frozenset, tuplas y patrones
+    compilados) y las instancias no guardan estado, por lo que una misma
+    instancia puede compartirse entre hilos sin sincronización.
     """
     
-    def __init__(self):
-        """Inicializa las reglas silábicas con expresiones regulares compiladas"""
-        # Definición del alfabeto
-        self.vocales_fuertes = set('aeoáéó')
-        self.vocales_debiles = set('iuíú')
-        self.vocales = self.vocales_fuertes | self.vocales_debiles
-        self.vocales_acentuadas = set('áéíóú')
-        
-        # Grupos especiales de consonantes
-        self.digrafos = ['ch', 'll', 'rr']
-        self.grupos_consonanticos = [
-            'pr', 'pl', 'br', 'bl', 'fr', 'fl',
-            'tr', 'dr', 'cr', 'cl', 'gr', 'gl'
-        ]
-        
-        # ==================== EXPRESIONES REGULARES COMPILADAS ====================
-        # Se compilan UNA VEZ para mejor rendimiento
-        
-        # Patrones vocálicos
-        self.patron_vocal = re.compile(r'[aeiouáéíóú]', re.IGNORECASE)
-        self.patron_vocal_fuerte = re.compile(r'[aeoáéó]', re.IGNORECASE)
-        self.patron_vocal_debil = re.compile(r'[iuíú]', re.IGNORECASE)
-        self.patron_vocal_acentuada = re.compile(r'[áéíóú]', re.IGNORECASE)
+    __slots__ = ()
+    
+    # Definición del alfabeto
+    vocales_fuertes = frozenset('aeoáéó')
+    vocales_debiles = frozenset('iuíúü')
+    vocales = vocales_fuertes | vocales_debiles
+    vocales_acentuadas = frozenset('áéíóú')
+    
+    # Grupos especiales de consonantes
+    digrafos = ('ch', 'll', 'rr')
+    grupos_consonanticos = (
+        'pr', 'pl', 'br', 'bl', 'fr', 'fl',
+        'tr', 'dr', 'cr', 'cl', 'gr', 'gl'
+    )
+    
+    # Tabla de normalización (minúsculas y vocales canónicas) en una sola pasada
+    tabla_normalizacion = _construir_tabla_normalizacion()
+    
+    # ==================== EXPRESIONES REGULARES COMPILADAS ====================
+    # Se compilan UNA VEZ, al definir la clase, y se comparten entre instancias
+    
+    # Patrones vocálicos
+    patron_vocal = re.compile(r'[aeiouáéíóúü]', re.IGNORECASE)
+    patron_vocal_fuerte = re.compile(r'[aeoáéó]', re.IGNORECASE)
+    patron_vocal_debil = re.compile(r'[iuíúü]', re.IGNORECASE)
+    patron_vocal_acentuada = re.compile(r'[áéíóú]', re.IGNORECASE)
+    
+    # Patrones consonánticos
+    patron_digrafo = re.compile(r'(ch|ll|rr)', re.IGNORECASE)
+    patron_grupo_consonantico = re.compile(
+        r'(pr|pl|br|bl|fr|fl|tr|dr|cr|cl|gr|gl)',
+        re.IGNORECASE
+    )
+    
+    # Patrones para análisis de diptongos
+    patron_diptongo = re.compile(
+        r'([aeoáéó][iuíúü]|[iuíúü][aeoáéó]|[iuü][iuü])',
+        re.IGNORECASE
+    )
+    
+    def normalizar(self, palabra):
+        """
+        Normaliza una palabra para su clasificación: composición NFC, minúsculas,
+        vocales canónicas y sin espacios en los extremos.
         
-        # Patrones consonánticos
-        self.patron_digrafo = re.compile(r'(ch|ll|rr)', re.IGNORECASE)
-        self.patron_grupo_consonantico = re.compile(
-            r'(pr|pl|br|bl|fr|fl|tr|dr|cr|cl|gr|gl)',
-            re.IGNORECASE
-        )
+        Args:
+            palabra (str): Palabra original
+            
+        Returns:
+            str: Palabra normalizada
+        """
+        return self.normalizar_lote(palabra).strip()
+    
+    def normalizar_lote(self, texto):
+        """
+        Normaliza un bloque de texto completo (por ejemplo, varias palabras unidas
+        por saltos de línea) con una composición NFC y un único str.translate.
+        Los saltos de línea se conservan.
         
-        # Patrones para análisis de diptongos
-        self.patron_diptongo = re.compile(
-            r'([aeoáéó][iuíú]|[iuíú][aeoáéó]|[iu][iu])',
-            re.IGNORECASE
-        )
+        Args:
+            texto (str): Texto a normalizar
+            
+        Returns:
+            str: Texto normalizado
+        """
+        if not texto.isascii() and not unicodedata.is_normalized('NFC', texto):
+            texto = unicodedata.normalize('NFC', texto)
+        return texto.translate(self.tabla_normalizacion)
     
     def es_vocal_fuerte(self, char):
         """Determina si un carácter es vocal fuerte (a, e, o) usando regex"""
@@ -133,13 +198,13 @@ class ReglasSilabicas:
         Detecta todos los dígrafos en una palabra usando regex
         
         Args:
-            palabra (str): Palabra a analizar
+            palabra (str): Palabra normalizada a analizar
             
         Returns:
             list: Lista de tuplas (posición, dígrafo)
         """
         digrafos = []
-        for match in self.patron_digrafo.finditer(palabra.lower()):
+        for match in self.patron_digrafo.finditer(palabra):
             digrafos.append((match.start(), match.group()))
         return digrafos
     
@@ -148,13 +213,13 @@ class ReglasSilabicas:
         Detecta todos los diptongos en una palabra usando regex
         
         Args:
-            palabra (str): Palabra a analizar
+            palabra (str): Palabra normalizada a analizar
             
         Returns:
             list: Lista de tuplas (posición, diptongo)
         """
         diptongos = []
-        for match in self.patron_diptongo.finditer(palabra.lower()):
+        for match in self.patron_diptongo.finditer(palabra):
             # Verificar que sea realmente un diptongo (no un hiato)
             if self.es_diptongo(match.group()[0], match.group()[1]):
                 diptongos.append((match.start(), match.group()))
@@ -165,13 +230,13 @@ class ReglasSilabicas:
         Extrae la estructura silábica (V=vocal, C=consonante)
         
         Args:
-            palabra (str): Palabra a analizar
+            palabra (str): Palabra normalizada a analizar
             
         Returns:
             str: Estructura de la palabra (ej: CVCCVC)
         """
         estructura = ""
-        for char in palabra.lower():
+        for char in palabra:
             if self.es_vocal(char):
                 estructura += "V"
             else:
@@ -188,18 +253,17 @@ class ReglasSilabicas:
         - Cualquier vocal + VD acentuada
         
         Args:
-            palabra (str): Palabra a analizar
+            palabra (str): Palabra normalizada a analizar
             
         Returns:
             list: Lista de tuplas (posición, hiato)
         """
         hiatos = []
-        palabra_lower = palabra.lower()
         
         # Buscar pares de vocales consecutivas
-        for i in range(len(palabra_lower) - 1):
-            char1 = palabra_lower[i]
-            char2 = palabra_lower[i + 1]
+        for i in range(len(palabra) - 1):
+            char1 = palabra[i]
+            char2 = palabra[i + 1]
             
             # Verificar si ambos caracteres son vocales
             if self.es_vocal(char1) and self.es_vocal(char2):
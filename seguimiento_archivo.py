@@ -0,0 +1,402 @@
+"""
+Módulo: Seguimiento de Archivo
+Descripción: Sigue un archivo de palabras al que otros procesos añaden líneas y
+             procesa solo lo nuevo, añadiendo los resultados a la salida
+"""
+
+import ctypes
+import ctypes.util
+import io
+import json
+import os
+import select
+import time
+
+from flujos_comprimidos import detectar_formato
+from procesador_archivos import ProcesadorArchivos
+
+
+class VigilanteInotify:
+    """
+    Espera cambios en un archivo con inotify (Linux), sin consumir CPU mientras
+    no hay actividad. Se usa a través de ctypes para no requerir dependencias.
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVE_SELF = 0x00000800
+    IN_DELETE_SELF = 0x00000400
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    def __init__(self, ruta):
+        """
+        Args:
+            ruta (str): Archivo a vigilar
+            
+        Raises:
+            OSError: Si inotify no está disponible
+        """
+        nombre = ctypes.util.find_library('c')
+        if not nombre:
+            raise OSError("libc no disponible")
+        libc = ctypes.CDLL(nombre, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify no disponible")
+        
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+        mascara = (self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE
+                   | self.IN_MOVE_SELF | self.IN_DELETE_SELF)
+        if libc.inotify_add_watch(self.fd, os.fsencode(ruta), mascara) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch falló")
+    
+    def esperar(self, tiempo_maximo):
+        """
+        Bloquea hasta que el archivo cambie o pase el tiempo indicado.
+        
+        Args:
+            tiempo_maximo (float): Segundos máximos de espera
+            
+        Returns:
+            bool: True si hubo eventos
+        """
+        listos, _, _ = select.select([self.fd], [], [], tiempo_maximo)
+        if not listos:
+            return False
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+    
+    def notificar_progreso(self, hubo_datos):
+        """Sin efecto: inotify no necesita ajustar su espera"""
+    
+    def cerrar(self):
+        """Libera el descriptor de inotify"""
+        os.close(self.fd)
+
+
+class VigilanteSondeo:
+    """
+    Espera cambios comprobando el tamaño del archivo periódicamente, con un
+    intervalo que se duplica mientras no hay datos nuevos (hasta un máximo) y
+    vuelve al mínimo en cuanto llegan.
+    """
+    
+    def __init__(self, ruta, intervalo_minimo=0.01, intervalo_maximo=1.0):
+        """
+        Args:
+            ruta (str): Archivo a vigilar
+            intervalo_minimo (float): Segundos entre comprobaciones con actividad
+            intervalo_maximo (float): Segundos máximos entre comprobaciones en reposo
+        """
+        self.ruta = ruta
+        self.intervalo_minimo = intervalo_minimo
+        self.intervalo_maximo = intervalo_maximo
+        self.intervalo = intervalo_minimo
+        self.firma = self._firma()
+    
+    def _firma(self):
+        """Tamaño, fecha de modificación e inodo actuales del archivo"""
+        try:
+            estado = os.stat(self.ruta)
+        except OSError:
+            return None
+        return estado.st_size, estado.st_mtime_ns, estado.st_ino
+    
+    def esperar(self, tiempo_maximo):
+        """
+        Duerme hasta que cambie la firma del archivo o pase el tiempo indicado.
+        
+        Args:
+            tiempo_maximo (float): Segundos máximos de espera
+            
+        Returns:
+            bool: True si el archivo cambió
+        """
+        limite = time.monotonic() + tiempo_maximo
+        while True:
+            firma = self._firma()
+            if firma != self.firma:
+                self.firma = firma
+                return True
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                return False
+            time.sleep(min(self.intervalo, restante))
+            self.intervalo = min(self.intervalo * 2, self.intervalo_maximo)
+    
+    def notificar_progreso(self, hubo_datos):
+        """Reinicia el intervalo de sondeo cuando llegan datos nuevos"""
+        if hubo_datos:
+            self.intervalo = self.intervalo_minimo
+    
+    def cerrar(self):
+        """Sin recursos que liberar"""
+
+
+def crear_vigilante(ruta):
+    """
+    Crea el mejor vigilante disponible para un archivo.
+    
+    Args:
+        ruta (str): Archivo a vigilar
+        
+    Returns:
+        VigilanteInotify | VigilanteSondeo: inotify si está disponible; sondeo si no
+    """
+    try:
+        return VigilanteInotify(ruta)
+    except (OSError, AttributeError):
+        return VigilanteSondeo(ruta)
+
+
+class SeguidorArchivo:
+    """
+    Procesa las líneas que se van añadiendo a un archivo de entrada.
+    
+    La salida empieza con el encabezado de la tabla y crece con una fila por
+    palabra; el análisis detallado se añade a <salida>.detalle. En
+    <salida>.seguimiento se guarda (de forma atómica, tras cada lote) el
+    desplazamiento de entrada ya procesado y el tamaño de ambas salidas, de modo
+    que al volver a seguir el mismo archivo se continúa donde se quedó, sin
+    repetir ni perder palabras aunque el proceso se haya interrumpido.
+    
+    Solo se procesan líneas completas: una línea a medio escribir se deja para
+    la siguiente lectura. Si el archivo se trunca o se reemplaza (rotación), se
+    vuelve a leer desde el principio del archivo nuevo.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, procesador=None, tamano_lote=1000, limite_vocabulario=100000):
+        """
+        Inicializa el seguidor.
+        
+        Args:
+            procesador (ProcesadorArchivos): Procesador que analiza y formatea cada palabra
+            tamano_lote (int): Palabras máximas por escritura
+            limite_vocabulario (int): Palabras distintas que se conservan en memoria
+        """
+        self.procesador = procesador or ProcesadorArchivos()
+        self.tamano_lote = tamano_lote
+        self.limite_vocabulario = limite_vocabulario
+        
+        self.palabras = 0
+        self.lotes = 0
+        self.latencia_total = 0.0
+        self.latencia_maxima = 0.0
+        self.mecanismo = None
+    
+    @staticmethod
+    def rutas_auxiliares(archivo_salida):
+        """
+        Obtiene las rutas de los archivos auxiliares del seguimiento.
+        
+        Args:
+            archivo_salida (str): Ruta del archivo de salida
+            
+        Returns:
+            dict: Rutas de 'detalle' y 'estado'
+        """
+        return {
+            'detalle': archivo_salida + '.detalle',
+            'estado': archivo_salida + '.seguimiento',
+        }
+    
+    def seguir(self, archivo_entrada, archivo_salida, duracion=None):
+        """
+        Sigue el archivo de entrada hasta que se interrumpa (Ctrl+C) o pase la duración.
+        
+        Args:
+            archivo_entrada (str): Archivo de texto plano al que se añaden palabras
+            archivo_salida (str): Archivo de salida (texto plano)
+            duracion (float): Segundos máximos de seguimiento (None = sin límite)
+            
+        Returns:
+            int: Palabras procesadas en total, incluidas las de ejecuciones anteriores
+        """
+        if detectar_formato(archivo_entrada, 'r') or detectar_formato(archivo_salida, 'w'):
+            print("Error: el modo seguimiento requiere archivos sin comprimir")
+            return 0
+        
+        rutas = self.rutas_auxiliares(archivo_salida)
+        estado = self._cargar_estado(rutas, archivo_entrada, archivo_salida)
+        limite = time.monotonic() + duracion if duracion is not None else None
+        vigilante = None
+        
+        try:
+            with open(archivo_salida, 'r+b' if estado else 'w+b') as salida, \
+                    open(rutas['detalle'], 'r+b' if estado else 'w+b') as detalle:
+                if estado is None:
+                    estado = {'desplazamiento_entrada': 0, 'identificador': None,
+                              'desplazamiento_salida': 0, 'desplazamiento_detalle': 0,
+                              'palabras': 0}
+                # Descartar lo escrito después del último estado guardado
+                for archivo, clave in ((salida, 'desplazamiento_salida'),
+                                       (detalle, 'desplazamiento_detalle')):
+                    archivo.truncate(estado[clave])
+                    archivo.seek(estado[clave])
+                if estado['desplazamiento_salida'] == 0:
+                    salida.write(self._encabezado())
+                    self._guardar_estado(rutas['estado'], archivo_entrada, estado, salida, detalle)
+                
+                vocabulario = {}
+                while limite is None or time.monotonic() < limite:
+                    identificador = self._identificar(archivo_entrada)
+                    if identificador is None:
+                        time.sleep(0.5)
+                        continue
+                    if identificador != estado['identificador']:
+                        # Archivo nuevo o rotado: se sigue desde su inicio
+                        estado['identificador'] = identificador
+                        estado['desplazamiento_entrada'] = 0
+                        if vigilante is not None:
+                            vigilante.cerrar()
+                        vigilante = crear_vigilante(archivo_entrada)
+                        self.mecanismo = type(vigilante).__name__
+                    elif vigilante is None:
+                        vigilante = crear_vigilante(archivo_entrada)
+                        self.mecanismo = type(vigilante).__name__
+                    if os.path.getsize(archivo_entrada) < estado['desplazamiento_entrada']:
+                        estado['desplazamiento_entrada'] = 0
+                    
+                    inicio = time.perf_counter()
+                    hubo_datos = self._procesar_nuevas(archivo_entrada, estado, vocabulario,
+                                                       salida, detalle, rutas['estado'])
+                    if hubo_datos:
+                        latencia = time.perf_counter() - inicio
+                        self.latencia_total += latencia
+                        self.latencia_maxima = max(self.latencia_maxima, latencia)
+                    vigilante.notificar_progreso(hubo_datos)
+                    
+                    espera = 1.0 if limite is None else max(0.0, min(1.0, limite - time.monotonic()))
+                    vigilante.esperar(espera)
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            print(f"Error durante el seguimiento: {e}")
+            return 0
+        finally:
+            if vigilante is not None:
+                vigilante.cerrar()
+        
+        self.palabras = estado['palabras'] if estado else 0
+        return self.palabras
+    
+    def _procesar_nuevas(self, archivo_entrada, estado, vocabulario, salida, detalle, ruta_estado):
+        """
+        Procesa por lotes las líneas completas añadidas desde el último desplazamiento.
+        
+        Returns:
+            bool: True si se procesó al menos una línea
+        """
+        procesador = self.procesador
+        hubo_datos = False
+        with open(archivo_entrada, 'rb') as entrada:
+            entrada.seek(estado['desplazamiento_entrada'])
+            while True:
+                palabras = []
+                desplazamiento = estado['desplazamiento_entrada']
+                while len(palabras) < self.tamano_lote:
+                    linea = entrada.readline()
+                    if not linea.endswith(b'\n'):
+                        break
+                    desplazamiento += len(linea)
+                    palabra = linea.decode('utf-8').strip()
+                    if palabra:
+                        palabras.append(palabra)
+                if desplazamiento == estado['desplazamiento_entrada']:
+                    return hubo_datos
+                
+                if len(vocabulario) > self.limite_vocabulario:
+                    vocabulario.clear()
+                filas = []
+                bloques_detalle = []
+                numero = estado['palabras']
+                for resultado in procesador._procesar_palabras(palabras, vocabulario):
+                    numero += 1
+                    filas.append(procesador._formatear_fila(resultado))
+                    bloques_detalle.append(procesador._formatear_detalle(numero, resultado))
+                salida.write(''.join(filas).encode('utf-8'))
+                detalle.write(''.join(bloques_detalle).encode('utf-8'))
+                
+                estado['desplazamiento_entrada'] = desplazamiento
+                estado['palabras'] = numero
+                self._guardar_estado(ruta_estado, archivo_entrada, estado, salida, detalle)
+                self.lotes += 1
+                hubo_datos = True
+                entrada.seek(desplazamiento)
+    
+    def _encabezado(self):
+        """Bytes del encabezado de la tabla de resultados"""
+        buffer = io.StringIO()
+        self.procesador._escribir_encabezado(buffer)
+        return buffer.getvalue().encode('utf-8')
+    
+    @staticmethod
+    def _identificar(archivo_entrada):
+        """Identifica el archivo por dispositivo e inodo (None si no existe)"""
+        try:
+            estado = os.stat(archivo_entrada)
+        except OSError:
+            return None
+        return [estado.st_dev, estado.st_ino]
+    
+    def _guardar_estado(self, ruta, archivo_entrada, estado, salida, detalle):
+        """Sincroniza (fsync) las salidas y publica el estado de forma atómica"""
+        for archivo in (salida, detalle):
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        estado['desplazamiento_salida'] = salida.tell()
+        estado['desplazamiento_detalle'] = detalle.tell()
+        datos = dict(estado, version=self.VERSION, entrada=os.path.abspath(archivo_entrada))
+        with open(ruta + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(datos, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(ruta + '.tmp', ruta)
+    
+    def _cargar_estado(self, rutas, archivo_entrada, archivo_salida):
+        """
+        Lee y valida el estado de un seguimiento anterior: debe corresponder al
+        mismo archivo de entrada (ruta, dispositivo e inodo) y sus desplazamientos
+        no pueden superar el tamaño actual de la salida y el detalle.
+        
+        Returns:
+            dict: Estado guardado o None si no existe o no corresponde
+        """
+        try:
+            with open(rutas['estado'], 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (estado.get('version') != self.VERSION
+                or estado.get('entrada') != os.path.abspath(archivo_entrada)
+                or estado.get('identificador') != self._identificar(archivo_entrada)):
+            return None
+        
+        for ruta, clave in ((archivo_salida, 'desplazamiento_salida'),
+                            (rutas['detalle'], 'desplazamiento_detalle')):
+            if not os.path.exists(ruta) or estado.get(clave, -1) > os.path.getsize(ruta):
+                return None
+        return estado
+    
+    def reporte(self):
+        """
+        Resume la actividad del seguimiento.
+        
+        Returns:
+            str: Palabras, lotes, latencia de procesamiento y mecanismo de espera
+        """
+        promedio = 1000.0 * self.latencia_total / self.lotes if self.lotes else 0.0
+        return (f"Palabras: {self.palabras} - Lotes: {self.lotes} - "
+                f"Latencia media: {promedio:.2f} ms (máx. {1000.0 * self.latencia_maxima:.2f} ms) - "
+                f"Espera: {self.mecanismo or 'ninguna'}")
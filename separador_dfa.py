@@ -4,7 +4,12 @@ Descripción: Implementación del Autómata Finito Determinista para separación
              Integrado con expresiones regulares para análisis avanzado
 """
 
+import os
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+
 from reglas_silabicas import ReglasSilabicas
+from utilidades import Utilidades
 
 
 class SeparadorDFA:
@@ -19,11 +24,41 @@ class SeparadorDFA:
     - q3: Secuencia vocálica (VV)
     - q4: Secuencia consonántica (CC)
     - qf: Fin de sílaba (insertar separador)
+    
+    Concurrencia: el separador no modifica su estado al separar (las reglas son
+    inmutables y el recorrido usa solo variables locales), así que una instancia
+    puede usarse desde varios hilos a la vez, incluso sin GIL.
     """
     
-    def __init__(self):
-        """Inicializa el separador DFA"""
+    __slots__ = ('reglas', 'cache')
+    
+    # Nombres de las reglas que puede aplicar el autómata (el orden es estable)
+    REGLAS = ('Hiato', 'V-C-V', 'V-GC', 'V-Digrafo-V', 'V-GC-V', 'VC-CV', 'VCC-GC', 'VCC-V')
+    
+    def __init__(self, cache=None):
+        """
+        Inicializa el separador DFA
+        
+        Args:
+            cache (CacheCompartida): Caché compartida de separaciones (opcional)
+        """
         self.reglas = ReglasSilabicas()
+        self.cache = cache
+    
+    def normalizar(self, palabra):
+        """
+        Normaliza una palabra antes de separarla (NFC, minúsculas, vocales
+        canónicas, sin espacios), en una sola pasada de str.translate.
+        
+        Dos palabras con la misma forma normalizada producen la misma separación.
+        
+        Args:
+            palabra (str): Palabra original
+            
+        Returns:
+            str: Palabra normalizada
+        """
+        return self.reglas.normalizar(palabra)
     
     def separar_silabas(self, palabra):
         """
@@ -36,7 +71,7 @@ class SeparadorDFA:
             tuple: (palabra_separada, lista_de_reglas_aplicadas, analisis_con_regex)
         """
         palabra_original = palabra
-        palabra = palabra.lower().strip()
+        palabra = self.normalizar(palabra)
         
         if not palabra:
             return "", [], {}
@@ -49,6 +84,144 @@ class SeparadorDFA:
             'hiatos': self.reglas.detectar_hiatos(palabra),
         }
         
+        posiciones, reglas_aplicadas = self._posiciones_normalizadas(palabra)
+        separacion = self.unir_silabas(palabra, posiciones)
+        
+        reglas_lista = sorted(reglas_aplicadas)
+        if not reglas_lista:
+            reglas_lista = ["Sílaba simple"]
+        
+        return separacion, reglas_lista, analisis
+    
+    def separar_lote(self, palabras, hilos=None, tamano_bloque=256):
+        """
+        Separa un lote de palabras repartiéndolo entre un grupo de hilos.
+        
+        En intérpretes free-threading (sin GIL) los bloques se procesan en
+        paralelo en todos los núcleos; con GIL se usa un solo hilo por defecto.
+        
+        Args:
+            palabras (list): Palabras a separar
+            hilos (int): Número de hilos (por defecto, según el GIL y los núcleos)
+            tamano_bloque (int): Palabras que procesa cada tarea del grupo
+            
+        Returns:
+            list: Resultados de separar_silabas en el mismo orden que la entrada
+        """
+        if hilos is None:
+            hilos = 1 if Utilidades.gil_habilitado() else (os.cpu_count() or 1)
+        
+        if hilos <= 1 or len(palabras) <= tamano_bloque:
+            return [self.separar_silabas(palabra) for palabra in palabras]
+        
+        bloques = [palabras[i:i + tamano_bloque] for i in range(0, len(palabras), tamano_bloque)]
+        resultados = []
+        with ThreadPoolExecutor(max_workers=hilos) as grupo:
+            for bloque in grupo.map(self._separar_bloque, bloques):
+                resultados.extend(bloque)
+        return resultados
+    
+    def _separar_bloque(self, palabras):
+        """Separa un bloque de palabras en el hilo actual"""
+        return [self.separar_silabas(palabra) for palabra in palabras]
+    
+    def obtener_posiciones(self, palabra):
+        """
+        Calcula las posiciones de separación silábica de una palabra.
+        
+        Args:
+            palabra (str): Palabra a separar
+            
+        Returns:
+            tuple: Desplazamientos (ordenados, sin repetir) sobre la palabra normalizada
+                   en los que comienza una nueva sílaba
+        """
+        palabra = self.normalizar(palabra)
+        if not palabra:
+            return ()
+        return self._posiciones_normalizadas(palabra)[0]
+    
+    def obtener_puntos_division(self, palabra, minimo=2):
+        """
+        Calcula dónde puede dividirse una palabra con guion a final de línea:
+        límites silábicos que dejan al menos 'minimo' letras a cada lado y que
+        no parten los dígrafos ch, ll y rr.
+        
+        Una letra es un carácter base junto con sus marcas combinantes (NFD):
+        los cortes nunca caen dentro de ella ni dentro de la expansión que
+        produce la normalización (İ pasa a 'i' más un punto combinante).
+        
+        Args:
+            palabra (str): Palabra original (en NFC o NFD, con mayúsculas o guiones blandos)
+            minimo (int): Letras mínimas antes y después del corte
+            
+        Returns:
+            tuple: Desplazamientos sobre la palabra recibida en los que puede cortarse
+        """
+        normalizada = self.normalizar(palabra)
+        if len(normalizada) < 2 * minimo:
+            return ()
+        
+        digrafos = self.reglas.digrafos
+        puntos = [
+            pos for pos in self._posiciones_normalizadas(normalizada)[0]
+            if normalizada[pos - 1:pos + 1] not in digrafos
+        ]
+        if normalizada == palabra or (palabra.isascii() and len(normalizada) == len(palabra)):
+            return tuple(pos for pos in puntos if minimo <= pos <= len(normalizada) - minimo)
+        
+        # Traducir cada desplazamiento normalizado al inicio de la letra
+        # original correspondiente; los que caen dentro de una letra se descartan
+        texto = palabra.strip()
+        desplazamiento = len(palabra) - len(palabra.lstrip())
+        limites = {}
+        posicion = letras = 0
+        i = 0
+        while i < len(texto):
+            fin = i + 1
+            while fin < len(texto) and unicodedata.combining(texto[fin]):
+                fin += 1
+            pieza = self.reglas.normalizar_lote(texto[i:fin])
+            if pieza:
+                limites.setdefault(posicion, (i + desplazamiento, letras))
+                posicion += len(pieza)
+                letras += 1
+            i = fin
+        
+        return tuple(
+            limites[pos][0] for pos in puntos
+            if pos in limites and minimo <= limites[pos][1] <= letras - minimo
+        )
+    
+    def _posiciones_normalizadas(self, palabra):
+        """
+        Obtiene las posiciones de separación de una palabra ya normalizada,
+        consultando primero la caché compartida si existe.
+        
+        Args:
+            palabra (str): Palabra normalizada, no vacía
+            
+        Returns:
+            tuple: (posiciones, conjunto_de_reglas_aplicadas)
+        """
+        if self.cache is not None:
+            encontrado = self.cache.consultar(palabra)
+            if encontrado is not None:
+                return encontrado
+        
+        posiciones_separacion, reglas_aplicadas = self._ejecutar_automata(palabra)
+        return tuple(sorted(set(posiciones_separacion))), reglas_aplicadas
+    
+    def _ejecutar_automata(self, palabra):
+        """
+        Recorre la palabra con el autómata y marca los puntos de separación.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            
+        Returns:
+            tuple: (lista_de_posiciones, conjunto_de_reglas_aplicadas)
+        """
         chars = list(palabra)
         n = len(chars)
         posiciones_separacion = []  # Posiciones donde se debe separar
@@ -136,26 +309,24 @@ class SeparadorDFA:
             
             i += 1
         
-        # Construir sílabas basadas en posiciones de separación
+        return posiciones_separacion, reglas_aplicadas
+    
+    @staticmethod
+    def unir_silabas(palabra, posiciones):
+        """
+        Construye la palabra separada con guiones a partir de sus posiciones de corte.
+        
+        Args:
+            palabra (str): Palabra normalizada
+            posiciones (tuple): Posiciones de separación ordenadas
+            
+        Returns:
+            str: Sílabas unidas con '-'
+        """
         silabas = []
-        posiciones_separacion.sort()
         inicio = 0
-        
-        for pos in posiciones_separacion:
-            if pos > inicio:
-                silabas.append(''.join(chars[inicio:pos]))
-                inicio = pos
-        
-        # Agregar resto
-        if inicio < n:
-            silabas.append(''.join(chars[inicio:]))
-        
-        # Si no hay separaciones, la palabra es una sola sílaba
-        if not silabas:
-            silabas = [palabra]
-        
-        reglas_lista = sorted(list(reglas_aplicadas))
-        if not reglas_lista:
-            reglas_lista = ["Sílaba simple"]
-        
-        return '-'.join(silabas), reglas_lista, analisis
+        for pos in posiciones:
+            silabas.append(palabra[inicio:pos])
+            inicio = pos
+        silabas.append(palabra[inicio:])
+        return '-'.join(silabas)
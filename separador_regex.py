@@ -0,0 +1,164 @@
+"""
+Módulo: Separador Regex
+Descripción: Motor alternativo de separación silábica que codifica todas las reglas
+             de frontera silábica en una sola expresión regular compilada y la
+             aplica de una vez sobre un lote completo de palabras
+"""
+
+import re
+
+from reglas_silabicas import ReglasSilabicas
+from separador_dfa import SeparadorDFA
+
+
+class SeparadorRegex:
+    """
+    Encuentra los puntos de separación silábica con una única expresión regular
+    de anchura cero (solo lookbehind/lookahead). Cada coincidencia es una
+    posición donde comienza una nueva sílaba.
+    
+    Las alternativas del patrón reproducen las reglas de SeparadorDFA:
+    - Hiato: VF|VF, V|VD acentuada, VD acentuada|V
+    - V-C-V: V|CV
+    - V-CC-V con dígrafo o grupo irrompible: V|CCV
+    - VC-CV con consonantes separables: VC|CV
+    - VCC-CCV (tres consonantes): VC|CCV
+    
+    Las palabras de un lote se unen con saltos de línea, que el patrón nunca
+    considera consonante, de modo que ninguna regla cruza de una palabra a otra.
+    """
+    
+    def __init__(self, reglas=None):
+        """
+        Inicializa el motor compilando el patrón a partir de las tablas de reglas.
+        
+        Args:
+            reglas (ReglasSilabicas): Reglas de clasificación (se comparten si se indican)
+        """
+        self.reglas = reglas or ReglasSilabicas()
+        self.patron = self._compilar_patron(self.reglas)
+    
+    @staticmethod
+    def _compilar_patron(reglas):
+        """
+        Construye la expresión regular de fronteras silábicas.
+        
+        Args:
+            reglas (ReglasSilabicas): Tablas de vocales, dígrafos y grupos
+            
+        Returns:
+            re.Pattern: Patrón compilado
+        """
+        def clase(caracteres):
+            return '[' + ''.join(sorted(caracteres)) + ']'
+        
+        vocal = clase(reglas.vocales)
+        fuerte = clase(reglas.vocales_fuertes)
+        debil_acentuada = clase(reglas.vocales_debiles & reglas.vocales_acentuadas)
+        consonante = '[^' + ''.join(sorted(reglas.vocales)) + '\\n]'
+        
+        pares = reglas.digrafos + reglas.grupos_consonanticos
+        par_inseparable = '(?:' + '|'.join(pares) + ')'
+        
+        # Segunda consonante que, tras la primera, forma un par inseparable
+        segundas = {}
+        for par in pares:
+            segundas.setdefault(par[0], []).append(par[1])
+        par_anterior = '|'.join(
+            f'(?<={primera}){clase(resto)}' for primera, resto in sorted(segundas.items())
+        )
+        
+        alternativas = [
+            # Hiato
+            f'(?<={fuerte})(?={fuerte})',
+            f'(?<={vocal})(?={debil_acentuada})',
+            f'(?<={debil_acentuada})(?={vocal})',
+            # V-C-V
+            f'(?<={vocal})(?={consonante}{vocal})',
+            # V-CC-V con dígrafo o grupo consonántico: separar antes del par
+            f'(?<={vocal})(?={par_inseparable}{vocal})',
+            # VC-CV (par separable) y VCC-CCV: separar tras la primera consonante
+            f'(?<={vocal}{consonante})(?:(?={consonante}{vocal})(?!{par_anterior})'
+            f'|(?={consonante}{consonante}{vocal}))',
+        ]
+        return re.compile('|'.join(alternativas))
+    
+    def posiciones_lote(self, palabras):
+        """
+        Calcula las posiciones de separación de un lote con un solo finditer.
+        
+        Args:
+            palabras (list): Palabras del lote (sin normalizar)
+            
+        Returns:
+            tuple: (palabras_normalizadas, lista_de_tuplas_de_posiciones)
+        """
+        normalizadas = [
+            palabra.strip()
+            for palabra in self.reglas.normalizar_lote('\n'.join(palabras)).split('\n')
+        ]
+        if len(normalizadas) != len(palabras):
+            # Algún carácter de salto de línea dentro de una palabra: normalizar una a una
+            normalizadas = [self.reglas.normalizar(palabra) for palabra in palabras]
+        buffer = '\n'.join(normalizadas)
+        
+        posiciones = [[] for _ in normalizadas]
+        indice = 0
+        inicio = 0
+        fin = len(normalizadas[0]) if normalizadas else 0
+        for coincidencia in self.patron.finditer(buffer):
+            pos = coincidencia.start()
+            while pos > fin:
+                indice += 1
+                inicio = fin + 1
+                fin = inicio + len(normalizadas[indice])
+            posiciones[indice].append(pos - inicio)
+        
+        return normalizadas, [tuple(p) for p in posiciones]
+    
+    def separar_lote(self, palabras):
+        """
+        Separa un lote de palabras.
+        
+        Args:
+            palabras (list): Palabras a separar
+            
+        Returns:
+            list: Palabras separadas con '-', en el mismo orden
+        """
+        normalizadas, posiciones = self.posiciones_lote(palabras)
+        return [
+            SeparadorDFA.unir_silabas(palabra, cortes) if palabra else ""
+            for palabra, cortes in zip(normalizadas, posiciones)
+        ]
+    
+    def separar(self, palabra):
+        """
+        Separa una sola palabra.
+        
+        Args:
+            palabra (str): Palabra a separar
+            
+        Returns:
+            str: Palabra separada con '-'
+        """
+        return self.separar_lote([palabra])[0]
+    
+    def verificar_contra_dfa(self, palabras, separador=None):
+        """
+        Compara este motor con SeparadorDFA (prueba diferencial).
+        
+        Args:
+            palabras (list): Palabras de prueba
+            separador (SeparadorDFA): Separador de referencia
+            
+        Returns:
+            list: Tuplas (palabra, resultado_regex, resultado_dfa) que no coinciden
+        """
+        separador = separador or SeparadorDFA()
+        discrepancias = []
+        for palabra, resultado in zip(palabras, self.separar_lote(palabras)):
+            esperado = separador.separar_silabas(palabra)[0]
+            if resultado != esperado:
+                discrepancias.append((palabra, resultado, esperado))
+        return discrepancias
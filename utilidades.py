@@ -4,6 +4,7 @@ Descripción: Funciones auxiliares y utilidades del programa
 """
 
 import os
+import sys
 
 
 class Utilidades:
@@ -50,6 +51,17 @@ class Utilidades:
         """
         return os.path.exists(archivo)
     
+    @staticmethod
+    def gil_habilitado():
+        """
+        Indica si el intérprete ejecuta con GIL.
+        
+        Returns:
+            bool: False solo en compilaciones free-threading con el GIL desactivado
+        """
+        verificar = getattr(sys, '_is_gil_enabled', None)
+        return True if verificar is None else verificar()
+    
     @staticmethod
     def mostrar_encabezado():
         """Muestra el encabezado del programa"""